@@ -6,8 +6,6 @@ import argparse
 import asyncio
 import sys
 
-from llmstxt_architect.extractor import bs4_extractor, default_extractor
-from llmstxt_architect.main import generate_llms_txt
 from llmstxt_architect.styling import color_text, draw_box
 
 
@@ -101,8 +99,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--extractor",
         default="default",
-        choices=["default", "bs4"],
-        help="Content extractor to use (default: markdownify, bs4: BeautifulSoup)",
+        choices=["default", "bs4", "html2text"],
+        help="Content extractor to use (default: markdownify, bs4: BeautifulSoup, html2text: html2text)",
     )
 
     parser.add_argument(
@@ -119,6 +117,12 @@ def parse_args() -> argparse.Namespace:
         help="Maximum number of concurrent LLM summarization calls (default: 5)",
     )
 
+    parser.add_argument(
+        "--use-uvloop",
+        action="store_true",
+        help="Run the event loop on uvloop for lower scheduling overhead (requires the uvloop extra)",
+    )
+
     parser.add_argument(
         "--orchestrator",
         default="local",
@@ -145,13 +149,8 @@ def parse_args() -> argparse.Namespace:
 
 def show_splash() -> None:
     """Display the splash screen."""
-    print(
-        color_text(
-            draw_box("LLMsTxt Architect - Generate LLMs.txt from web content", "green", 2),
-            "green",
-        )
-    )
-    print()
+    box = draw_box("LLMsTxt Architect - Generate LLMs.txt from web content", "green", 2)
+    sys.stdout.write(color_text(box, "green") + "\n\n")
 
 
 def main() -> None:
@@ -161,9 +160,33 @@ def main() -> None:
     # Show splash screen
     show_splash()
 
-    # Map extractor choice to function (these are coroutines, will be awaited internally)
-    extractor_map = {"default": default_extractor, "bs4": bs4_extractor}
-    extractor_func = extractor_map[args.extractor]
+    if args.extractor == "html2text":
+        try:
+            import html2text  # noqa: F401
+        except ImportError:
+            print(
+                color_text(
+                    "Error: html2text is not installed. "
+                    "Install with: pip install 'llmstxt_architect[html2text]'",
+                    "red",
+                )
+            )
+            sys.exit(1)
+
+    # Pick the event loop runner; uvloop is an optional drop-in replacement
+    run = asyncio.run
+    if args.use_uvloop:
+        try:
+            import uvloop
+        except ImportError:
+            print(
+                color_text(
+                    "Error: uvloop is not installed. Install with: pip install 'llmstxt_architect[uvloop]'",
+                    "red",
+                )
+            )
+            sys.exit(1)
+        run = uvloop.run
 
     # Handle --workflow-id: reconnect to existing Temporal workflow
     if args.workflow_id:
@@ -183,7 +206,7 @@ def main() -> None:
             sys.exit(1)
 
         try:
-            asyncio.run(
+            run(
                 get_workflow_result(
                     workflow_id=args.workflow_id,
                     temporal_address=args.temporal_address,
@@ -256,7 +279,7 @@ def main() -> None:
                 )
                 sys.exit(1)
 
-            asyncio.run(
+            run(
                 run_temporal_workflow(
                     urls=urls,
                     max_depth=args.max_depth,
@@ -276,7 +299,20 @@ def main() -> None:
                 )
             )
         else:
-            asyncio.run(
+            # Imported here so --workflow-id and Temporal runs skip loading the
+            # extractor/LLM stack in the CLI process
+            from llmstxt_architect.extractor import bs4_extractor, default_extractor, html2text_extractor
+            from llmstxt_architect.main import generate_llms_txt
+
+            # Map extractor choice to function (plain functions, run off the event loop by the loader)
+            extractor_map = {
+                "default": default_extractor,
+                "bs4": bs4_extractor,
+                "html2text": html2text_extractor,
+            }
+            extractor_func = extractor_map[args.extractor]
+
+            run(
                 generate_llms_txt(
                     urls=urls,
                     max_depth=args.max_depth,
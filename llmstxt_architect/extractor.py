@@ -2,34 +2,74 @@
 Content extraction utilities for web pages.
 """
 
+import atexit
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 
-from bs4 import BeautifulSoup
-from markdownify import markdownify
+from bs4 import BeautifulSoup, Tag
+from markdownify import MarkdownConverter
 
+# Tags whose contents never contribute readable page text
+_PRUNED_TAGS = frozenset({"script", "style", "noscript", "svg", "template"})
 
-def bs4_extractor(html: str) -> str:
+_HIDDEN_STYLE = re.compile(r"display\s*:\s*none", re.IGNORECASE)
+
+# Runs of three or more newlines; exactly two are already in canonical form
+_MULTI_NL = re.compile(r"\n{3,}")
+
+
+def _is_pruned(tag: Tag) -> bool:
+    """Check whether a tag is a non-content or hidden subtree."""
+    if tag.name in _PRUNED_TAGS:
+        return True
+    style = tag.get("style")
+    return isinstance(style, str) and bool(_HIDDEN_STYLE.search(style))
+
+
+def _prune_soup(soup: BeautifulSoup) -> BeautifulSoup:
     """
-    Extract content from HTML using BeautifulSoup.
+    Remove scripts, styles, inline SVG and hidden elements from a parsed page.
+
+    Dropping these subtrees up front keeps them out of the extracted text and
+    shrinks the tree every later traversal has to walk.
 
     Args:
-        html: The HTML content to extract from
+        soup: The parsed document, modified in place
 
     Returns:
-        Extracted text content
+        The same soup, for chaining
     """
-    soup = BeautifulSoup(html, "lxml")
+    for tag in soup.find_all(_is_pruned):
+        tag.decompose()
+    return soup
+
 
+def _soup_text(soup: BeautifulSoup) -> str:
+    """Get the plain text of a pruned page, preferring the main article."""
     # Target the main article content for LangGraph documentation
-    main_content = soup.find("article", class_="md-content__inner")
+    main_content = soup.select_one("article.md-content__inner")
 
     # If found, use that, otherwise fall back to the whole document
     content = main_content.get_text() if main_content else soup.text
 
     # Clean up whitespace
-    content = re.sub(r"\n\n+", "\n\n", content).strip()
+    return _MULTI_NL.sub("\n\n", content).strip()
 
-    return content
+
+def bs4_extractor(html: str) -> str:
+    """
+    Extract content from HTML using BeautifulSoup.
+
+    Args:
+        html: The HTML content to extract from
+
+    Returns:
+        Extracted text content
+    """
+    return _soup_text(_prune_soup(BeautifulSoup(html, "lxml")))
 
 
 def default_extractor(html: str) -> str:
@@ -45,8 +85,86 @@ def default_extractor(html: str) -> str:
     Returns:
         Markdown converted content
     """
+    soup = _prune_soup(BeautifulSoup(html, "lxml"))
     try:
-        result = markdownify(html)
+        result = MarkdownConverter().convert_soup(soup)
         return str(result)
     except RecursionError:
-        return bs4_extractor(html)
+        # markdownify only reads the tree, so the fallback can reuse it
+        return _soup_text(soup)
+
+
+def html2text_extractor(html: str) -> str:
+    """
+    Extract content from HTML and convert to markdown using html2text.
+
+    html2text walks the document with the stdlib HTML parser instead of a
+    BeautifulSoup tree, so it is faster on large pages and does not hit the
+    recursion limit on deeply nested HTML. Requires the optional extra:
+    pip install 'llmstxt_architect[html2text]'
+
+    Args:
+        html: The HTML content to extract from
+
+    Returns:
+        Markdown converted content
+    """
+    import html2text
+
+    # HTML2Text instances hold parser state, so use a fresh one per page
+    converter = html2text.HTML2Text()
+    converter.body_width = 0
+    converter.ignore_images = True
+    return converter.handle(html).strip()
+
+
+# Built-in extractors are module-level functions, so they can be pickled and
+# sent to worker processes; user-supplied extractors may not be
+PROCESS_SAFE_EXTRACTORS = frozenset({default_extractor, bs4_extractor, html2text_extractor})
+
+# Pages at least this large are worth the IPC cost of a worker process
+PROCESS_POOL_MIN_SIZE = 50_000
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared process pool for CPU-heavy extraction, creating it on first use.
+
+    Returns:
+        Process pool sized to the number of CPUs
+    """
+    global _process_pool
+    if _process_pool is None:
+        # Workers are spawned rather than forked: forking a process that runs an
+        # event loop and HTTP client threads can deadlock the child
+        _process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        )
+    return _process_pool
+
+
+def discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Drop a broken process pool so the next get_process_pool() call starts a fresh one.
+
+    Args:
+        pool: The pool that failed; ignored if it was already replaced
+    """
+    global _process_pool
+    if _process_pool is pool:
+        _process_pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the shared process pool, if one was created."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+
+
+# Long-lived callers such as the Temporal worker never shut the pool down themselves
+atexit.register(shutdown_process_pool)
@@ -5,12 +5,28 @@ URL loading and document processing.
 import asyncio
 import re
 from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
 from typing import Callable, Dict, List, Optional, Tuple
 
 import httpx
 from langchain_community.document_loaders import RecursiveUrlLoader
 from langchain_core.documents import Document
 
+from llmstxt_architect.extractor import (
+    PROCESS_POOL_MIN_SIZE,
+    PROCESS_SAFE_EXTRACTORS,
+    discard_process_pool,
+    get_process_pool,
+)
+
+# Markdown link "[title](url)" as used for page entries in llms.txt files
+URL_PATTERN = re.compile(r"\[(.*?)\]\((https?://[^\s)]+)\)")
+
+_TITLE_PATTERN = re.compile(r"<title>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+# Port suffixes that normalize_url drops, by scheme
+_DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+
 
 async def load_urls(
     urls: List[str],
@@ -101,13 +117,15 @@ async def load_urls_directly(
     # Use normalized URLs for comparison
     processed_urls = set()
 
-    # Configure client with reasonable defaults
-    timeout = httpx.Timeout(30.0)  # 30 seconds
-    limits = httpx.Limits(max_connections=10)  # Limit concurrent connections
-
     # Process URLs in batches to avoid overwhelming the system
     batch_size = 10
 
+    # Configure client with reasonable defaults
+    timeout = httpx.Timeout(30.0)  # 30 seconds
+    # Only one batch is in flight at a time, so size the pool to the batch
+    # and keep every connection alive between batches
+    limits = httpx.Limits(max_connections=batch_size, max_keepalive_connections=batch_size)
+
     # Deduplicate URLs before processing
     unique_batches = []
     for i in range(0, len(urls), batch_size):
@@ -131,12 +149,15 @@ async def load_urls_directly(
 
     print(f"Loading {len(processed_urls)} unique URLs (batch size: {batch_size})...")
 
-    # Process each batch of unique URLs
-    for batch in unique_batches:
-        batch_docs = []
+    # Share one client across all batches so pooled connections are reused
+    # instead of paying a fresh TCP/TLS handshake for every batch
+    # HTTP/2 multiplexes the requests to a single host over one connection
+    async with httpx.AsyncClient(timeout=timeout, limits=limits, http2=True) as client:
+        # Process each batch of unique URLs
+        for batch in unique_batches:
+            batch_docs = []
 
-        # Create tasks to fetch URLs concurrently
-        async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+            # Create tasks to fetch URLs concurrently
             tasks = []
             for url in batch:
                 tasks.append(fetch_url(client, url, extractor))
@@ -154,12 +175,12 @@ async def load_urls_directly(
                     batch_docs.append(result)
                     successful += 1
 
-        # Add batch results to main list
-        docs.extend(batch_docs)
+            # Add batch results to main list
+            docs.extend(batch_docs)
 
-        # Report progress
-        processed_so_far = min(successful + len(errors), len(processed_urls))
-        print(f"Progress: {processed_so_far}/{len(processed_urls)} unique URLs processed")
+            # Report progress
+            processed_so_far = min(successful + len(errors), len(processed_urls))
+            print(f"Progress: {processed_so_far}/{len(processed_urls)} unique URLs processed")
 
     # Report final results
     print(f"Successfully loaded {successful} URLs")
@@ -194,11 +215,24 @@ async def fetch_url(
         response.raise_for_status()
 
         # Extract page title
-        title = extract_title(response.text) or url.split("/")[-1]
+        title = extract_title(response.text) or url.rpartition("/")[2]
 
-        # Extract content (run in thread to avoid blocking event loop with CPU work)
+        # Extract content off the event loop: large pages go to a worker process
+        # so markdownify's CPU work doesn't hold the GIL, the rest to a thread
         if extractor:
-            content = await asyncio.to_thread(extractor, response.text)
+            html = response.text
+            if extractor in PROCESS_SAFE_EXTRACTORS and len(html) >= PROCESS_POOL_MIN_SIZE:
+                loop = asyncio.get_running_loop()
+                pool = get_process_pool()
+                try:
+                    content = await loop.run_in_executor(pool, extractor, html)
+                except BrokenProcessPool:
+                    # A worker died (e.g. killed for memory); replace the pool
+                    # for later pages and extract this one in a thread
+                    discard_process_pool(pool)
+                    content = await asyncio.to_thread(extractor, html)
+            else:
+                content = await asyncio.to_thread(extractor, html)
         else:
             content = response.text
 
@@ -211,7 +245,7 @@ async def fetch_url(
 
 def extract_title(html_content: str) -> Optional[str]:
     """Extract title from HTML content."""
-    title_match = re.search(r"<title>(.*?)</title>", html_content, re.IGNORECASE | re.DOTALL)
+    title_match = _TITLE_PATTERN.search(html_content)
     if title_match:
         return title_match.group(1).strip()
     return None
@@ -230,7 +264,6 @@ async def extract_urls_from_llms_file(file_path: str) -> List[str]:
     """
     # Use OrderedDict to preserve order while deduplicating
     unique_urls = OrderedDict()
-    url_pattern = re.compile(r"\[(.*?)\]\((https?://[^\s)]+)\)")
 
     try:
         # Check if the input is a URL or a local file path
@@ -245,7 +278,7 @@ async def extract_urls_from_llms_file(file_path: str) -> List[str]:
             source_desc = f"local file: {file_path}"
 
         # Parse URLs from content
-        matches = url_pattern.findall(content)
+        matches = URL_PATTERN.findall(content)
 
         # Process URLs, normalizing and deduplicating
         for match in matches:
@@ -301,12 +334,23 @@ def normalize_url(url: str) -> str:
     Returns:
         Normalized URL
     """
+    # Drop the fragment; it never changes the page that gets fetched
+    normalized = url.partition("#")[0]
+
     # Remove trailing slash if present
-    normalized = url.rstrip("/")
+    normalized = normalized.rstrip("/")
 
     # Convert to lowercase for better matching
     normalized = normalized.lower()
 
+    # Drop default ports, e.g. https://example.com:443/docs -> https://example.com/docs
+    scheme, sep, rest = normalized.partition("://")
+    if sep:
+        host, slash, path = rest.partition("/")
+        default_port = _DEFAULT_PORTS.get(scheme)
+        if default_port and host.endswith(default_port):
+            normalized = f"{scheme}://{host[: -len(default_port)]}{slash}{path}"
+
     # Further normalization can be added here (e.g., removing www, query params, etc.)
 
     return normalized
@@ -352,7 +396,6 @@ def parse_existing_llms_file_content(
     """
     url_to_description = {}
     file_structure = []
-    url_pattern = re.compile(r"\[(.*?)\]\((https?://[^\s)]+)\)")
 
     for line in lines:
         file_structure.append(line)
@@ -363,7 +406,7 @@ def parse_existing_llms_file_content(
             continue
 
         # Check if line contains a URL
-        match = url_pattern.search(line_stripped)
+        match = URL_PATTERN.search(line_stripped)
         if match:
             title = match.group(1)
             url = match.group(2)
@@ -2,10 +2,11 @@
 Core functionality for generating LLMs.txt files.
 """
 
+import asyncio
 import time
 from typing import Any, Callable, Dict, List, Optional
 
-from llmstxt_architect.extractor import default_extractor
+from llmstxt_architect.extractor import default_extractor, shutdown_process_pool
 from llmstxt_architect.loader import load_urls, parse_existing_llms_file
 from llmstxt_architect.styling import generate_summary_report, status_message
 from llmstxt_architect.summarizer import Summarizer
@@ -114,7 +115,12 @@ async def generate_llms_txt(
 
     # Load all documents
     print(status_message("Loading and processing URLs...", "processing"))
-    docs = await load_urls(urls, max_depth, extractor, existing_llms_file, max_concurrent_crawls)
+    try:
+        docs = await load_urls(urls, max_depth, extractor, existing_llms_file, max_concurrent_crawls)
+    finally:
+        # Crawling is done, so release the extraction worker processes; joining
+        # them blocks, so do it off the event loop
+        await asyncio.to_thread(shutdown_process_pool)
     stats["urls_processed"] = len(docs)
 
     # Initialize summarizer
@@ -149,10 +155,11 @@ async def generate_llms_txt(
         summaries = []  # Use empty list if interrupted
         # For error recovery, only check txt-format summaries (strings)
         str_summaries = [s for s in summaries if isinstance(s, str)]
+        summarized_sources = {s.split("](")[1].split(")")[0] for s in str_summaries}
         stats["failed_urls"] = [
             doc.metadata.get("source", "")
             for doc in docs
-            if doc.metadata.get("source", "") not in [s.split("](")[1].split(")")[0] for s in str_summaries]
+            if doc.metadata.get("source", "") not in summarized_sources
         ]
     finally:
         # Always generate the final output file, even if interrupted
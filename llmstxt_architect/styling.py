@@ -2,6 +2,7 @@
 Terminal styling utilities for LLMsTxt Architect.
 """
 
+from functools import lru_cache
 from typing import Any, Dict
 
 ANSI_COLORS = {
@@ -29,6 +30,7 @@ def color_text(text: str, color: str) -> str:
     return f"{code}{text}{reset}"
 
 
+@lru_cache(maxsize=32)
 def draw_box(text: str, color: str, padding: int = 1) -> str:
     """Draw a box around text using Unicode box-drawing characters."""
     pad = " " * padding
@@ -40,10 +42,15 @@ def draw_box(text: str, color: str, padding: int = 1) -> str:
     return f"{top}\n{mid}\n{bot}"
 
 
+# Status prefixes with their color codes applied, built once at import time
+_COLORED_PREFIXES = {
+    status_type: color_text(prefix, color) for status_type, (color, prefix) in STATUS_PREFIXES.items()
+}
+
+
 def status_message(text: str, status_type: str) -> str:
     """Format a status message with a colored prefix."""
-    color, prefix = STATUS_PREFIXES.get(status_type, ("blue", "[i]"))
-    return f"{color_text(prefix, color)} {text}"
+    return f"{_COLORED_PREFIXES.get(status_type, _COLORED_PREFIXES['info'])} {text}"
 
 
 def generate_summary_report(stats: Dict[str, Any]) -> str:
@@ -5,12 +5,14 @@ LLM-based summarization of web page content.
 import asyncio
 import json
 import os
-import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Union
+from urllib.parse import urlparse
 
 from langchain.chat_models import init_chat_model
 
+from llmstxt_architect.loader import URL_PATTERN, normalize_url
+
 
 def build_jsonl_prompt(user_prompt: str) -> str:
     """
@@ -113,9 +115,9 @@ class Summarizer:
         with open(self.log_file, "r") as f:
             return json.load(f)
 
-    def _load_blacklist(self) -> List[str]:
+    def _load_blacklist(self) -> FrozenSet[str]:
         """Load blacklisted URLs from a file."""
-        blacklisted_urls = []
+        blacklisted_urls: FrozenSet[str] = frozenset()
 
         if self.blacklist_file and os.path.exists(self.blacklist_file):
             with open(self.blacklist_file, "r") as f:
@@ -123,8 +125,9 @@ class Summarizer:
                 urls = [line.strip() for line in f.readlines()]
                 urls = [url for url in urls if url and not url.startswith("#")]
 
-                # Normalize URLs by removing trailing slashes
-                blacklisted_urls = [url.rstrip("/") for url in urls]
+                # Normalize URLs by removing trailing slashes; a set makes the
+                # per-URL blacklist checks O(1)
+                blacklisted_urls = frozenset(url.rstrip("/") for url in urls)
 
             print(f"Loaded {len(blacklisted_urls)} blacklisted URLs from {self.blacklist_file}")
 
@@ -150,8 +153,6 @@ class Summarizer:
     def _get_summary_filename(self, url: str) -> str:
         """Generate a filename for the summary based on the URL."""
         # Create a valid filename from the URL
-        from urllib.parse import urlparse
-
         parsed = urlparse(url)
         filename = f"{parsed.netloc}{parsed.path}".replace("/", "_")
         if not filename.endswith(".txt"):
@@ -164,8 +165,6 @@ class Summarizer:
         This helps preserve titles when updating only descriptions.
         Can handle both local files and remote URLs.
         """
-        url_pattern = re.compile(r"\[(.*?)\]\((https?://[^\s)]+)\)")
-
         try:
             # Check if the input is a URL or a local file path
             if self.existing_llms_file.startswith(("http://", "https://")):
@@ -185,7 +184,7 @@ class Summarizer:
                 source_desc = f"local file: {self.existing_llms_file}"
 
             # Extract titles from content
-            matches = url_pattern.findall(content)
+            matches = URL_PATTERN.findall(content)
 
             for title, url in matches:
                 self.url_titles[url] = title
@@ -252,7 +251,7 @@ class Summarizer:
             if url in self.url_titles:
                 title = self.url_titles[url]
             else:
-                title = doc.metadata.get("title", url.split("/")[-1])
+                title = doc.metadata.get("title", url.rpartition("/")[2])
 
             if self.output_format == "jsonl":
                 # Parse JSON response and build JSONL entry
@@ -335,8 +334,21 @@ class Summarizer:
                     print(f"Failed to summarize document {url}: {str(e)}")
                     return None
 
+        # Drop documents that resolve to an already-seen URL so each page is
+        # only sent to the LLM once (e.g. "/page" and "/page/" from the crawler)
+        seen_urls = set()
+        unique_docs = []
+        for doc in docs:
+            url = normalize_url(doc.metadata.get("source", ""))
+            if url and url in seen_urls:
+                continue
+            seen_urls.add(url)
+            unique_docs.append(doc)
+        if len(unique_docs) < len(docs):
+            print(f"Skipping {len(docs) - len(unique_docs)} duplicate documents.")
+
         # Run all summarizations concurrently (bounded by semaphore)
-        results = await asyncio.gather(*[_summarize_one(doc) for doc in docs])
+        results = await asyncio.gather(*[_summarize_one(doc) for doc in unique_docs])
 
         # Filter out None results
         summaries: List[Union[str, Dict[str, Any]]] = [s for s in results if s is not None]
@@ -371,53 +383,43 @@ class Summarizer:
             summaries: List of summaries from current run
             output_file: File to save to
         """
-        # Collect all available summaries from the output directory with their URLs
-        summary_entries = []
-
-        # Pattern to extract URL from summary
-        url_pattern = re.compile(r"\[(.*?)\]\((https?://[^\s)]+)\)")
+        # Single pass over the summary files: count them, drop blacklisted URLs and
+        # keep the best content per normalized URL. The longest summary is used as a
+        # heuristic for "best"; on a tie the first one seen wins.
+        best_by_url: Dict[str, str] = {}
+        total_files = 0
+        blacklisted_count = 0
+        output_name = os.path.basename(output_file)
 
-        # First add all summaries from files
         for filename in os.listdir(self.output_dir):
-            if filename.endswith(".txt") and filename != os.path.basename(output_file):
-                file_path = os.path.join(self.output_dir, filename)
-                with open(file_path, "r") as f:
-                    summary_content = f.read()
+            if not filename.endswith(".txt") or filename == output_name:
+                continue
+            total_files += 1
 
-                    # Extract URL from summary content
-                    match = url_pattern.search(summary_content)
-                    url = match.group(2) if match else filename  # Use URL or filename as fallback
+            file_path = os.path.join(self.output_dir, filename)
+            with open(file_path, "r") as f:
+                summary_content = f.read()
 
-                    # Normalize URL by removing trailing slash if present
-                    normalized_url = url.rstrip("/")
+            # Extract URL from summary content
+            match = URL_PATTERN.search(summary_content)
+            url = match.group(2) if match else filename  # Use URL or filename as fallback
 
-                    # Store tuple of (normalized_url, content)
-                    summary_entries.append((normalized_url, summary_content))
+            # Normalize URL by removing trailing slash if present
+            normalized_url = url.rstrip("/")
 
-        # Group entries by normalized URL
-        url_to_entries = {}
-        for url, content in summary_entries:
             # Skip blacklisted URLs
-            if url in self.blacklisted_urls:
+            if normalized_url in self.blacklisted_urls:
+                blacklisted_count += 1
                 continue
 
-            if url not in url_to_entries:
-                url_to_entries[url] = []
-            url_to_entries[url].append(content)
-
-        # For each URL, select the best/most recent content
-        # (We'll use the longest summary as a heuristic for "best")
-        unique_entries = []
-        for url, contents in url_to_entries.items():
-            # Sort by length in descending order (longest first)
-            contents.sort(key=len, reverse=True)
-            # Take the first (longest) entry
-            unique_entries.append((url, contents[0]))
+            current = best_by_url.get(normalized_url)
+            if current is None or len(summary_content) > len(current):
+                best_by_url[normalized_url] = summary_content
 
         # Additional deduplication based on content
         final_entries = []
         seen_content = set()
-        for url, content in unique_entries:
+        for url, content in best_by_url.items():
             # Skip exact duplicate content
             if content not in seen_content:
                 final_entries.append((url, content))
@@ -428,19 +430,9 @@ class Summarizer:
 
         # Write the sorted summaries to the output file
         with open(output_file, "w") as f:
-            for _, content in sorted_entries:
-                f.write(content)
-
-        # Get counts for logging
-        total_files = sum(
-            1
-            for f in os.listdir(self.output_dir)
-            if f.endswith(".txt") and f != os.path.basename(output_file)
-        )
-        duplicates_removed = total_files - len(sorted_entries)
+            f.write("".join(content for _, content in sorted_entries))
 
-        # Count blacklisted URLs that were in the summary files
-        blacklisted_count = sum(1 for url, _ in summary_entries if url in self.blacklisted_urls)
+        duplicates_removed = total_files - len(sorted_entries)
 
         # Customize message based on context - are we in progress or final output
         is_progress_update = not output_file.endswith(os.path.basename(output_file))
@@ -467,12 +459,11 @@ class Summarizer:
             file_structure: Original file structure as a list of lines
         """
         # Build a map of URLs to their updated summaries
-        url_pattern = re.compile(r"\[(.*?)\]\((https?://[^\s)]+)\)")
         url_to_summary = {}
 
         # From newly generated summaries
         for summary in summaries:
-            match = url_pattern.search(summary)
+            match = URL_PATTERN.search(summary)
             if match:
                 url = match.group(2)
                 url_to_summary[url] = summary.strip()
@@ -483,7 +474,7 @@ class Summarizer:
                 file_path = os.path.join(self.output_dir, filename)
                 with open(file_path, "r") as f:
                     content = f.read()
-                    match = url_pattern.search(content)
+                    match = URL_PATTERN.search(content)
                     if match:
                         url = match.group(2)
                         if url not in url_to_summary:  # Don't overwrite newer summaries
@@ -492,21 +483,22 @@ class Summarizer:
         # Create a new file with preserved structure but updated descriptions
         output_lines = []
         updated_count = 0
-        preserved_count = 0
+        not_updated: List[str] = []  # URLs from the original file with no updated summary
 
         for line in file_structure:
             # Check if line contains a URL that needs to be updated
-            match = url_pattern.search(line)
+            match = URL_PATTERN.search(line)
             if match:
                 url = match.group(2)
+                updated_summary = url_to_summary.get(url)
                 # If we have an updated summary for this URL, use it
-                if url in url_to_summary:
-                    output_lines.append(url_to_summary[url] + "\n")
+                if updated_summary is not None:
+                    output_lines.append(updated_summary + "\n")
                     updated_count += 1
                 else:
                     # Keep the original line if no update available
                     output_lines.append(line)
-                    preserved_count += 1
+                    not_updated.append(url)
             else:
                 # Keep the original line for structure (headers, blank lines, etc.)
                 output_lines.append(line)
@@ -521,19 +513,11 @@ class Summarizer:
 
         print(f"{message_prefix} {output_file} with preserved structure:")
         print(f"  - {updated_count} descriptions updated")
-        print(f"  - {preserved_count} descriptions preserved (no updates available)")
+        print(f"  - {len(not_updated)} descriptions preserved (no updates available)")
         print("  - Original structure maintained (headers, spacing, ordering)")
 
         # Only show detailed stats for final output, not progress updates
         if not is_progress_update:
-            # Identify URLs in original file that were not updated
-            original_urls = []
-            for line in file_structure:
-                match = url_pattern.search(line)
-                if match:
-                    original_urls.append(match.group(2))
-
-            not_updated = [url for url in original_urls if url not in url_to_summary]
             if not_updated:
                 print(
                     f"Warning: {len(not_updated)} URLs from original file were not updated:"
@@ -554,7 +538,10 @@ class Summarizer:
             output_file: File to save to
         """
         # Collect all entries - from results and from stored entries
-        all_entries = list(results) + [e for e in self.jsonl_entries if e not in results]
+        # (results are normally the same dict objects as the stored entries, so
+        # match on identity instead of deep-comparing every pair of dicts)
+        result_ids = {id(e) for e in results}
+        all_entries = list(results) + [e for e in self.jsonl_entries if id(e) not in result_ids]
 
         # Deduplicate by URL
         seen_urls: set = set()
@@ -8,3 +8,7 @@ execution of the crawl-and-summarize pipeline. Install with:
 """
 
 TASK_QUEUE = "llmstxt-architect"
+
+# Short bookkeeping activities run on their own queue so they never wait
+# behind long crawls or LLM calls on TASK_QUEUE
+FAST_TASK_QUEUE = "llmstxt-fast"
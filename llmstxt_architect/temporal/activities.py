@@ -6,16 +6,29 @@ summarize documents, write files). They use simple dataclass params for
 serialization across the Temporal boundary.
 """
 
+import asyncio
 import hashlib
 import json
 import os
 import re
+from array import array
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
 
+import orjson
 from temporalio import activity
 
+# Markdown link "[title](url)" at the start of each txt summary (same as loader.URL_PATTERN,
+# which isn't imported here to keep the loader's crawling dependencies out of this module)
+_URL_PATTERN = re.compile(r"\[(.*?)\]\((https?://[^\s)]+)\)")
+
+# Largest manifest returned inline from discover_urls; well under Temporal's
+# ~2MB payload limit, since the result is also stored in the workflow history
+INLINE_MANIFEST_MAX_BYTES = 256 * 1024
+
 
 @dataclass
 class DiscoverUrlsInput:
@@ -26,6 +39,9 @@ class DiscoverUrlsInput:
     max_depth: int = 5
     extractor_name: str = "default"
     existing_llms_file: Optional[str] = None
+    blacklisted_urls: List[str] = field(default_factory=list)
+    url_titles: Dict[str, str] = field(default_factory=dict)
+    file_structure: Optional[List[str]] = None
 
 
 @dataclass
@@ -35,10 +51,19 @@ class DiscoverUrlsOutput:
     All data is saved to a manifest file on disk to avoid exceeding
     Temporal's payload size limit (~2MB). Only the manifest path and
     document count are returned through the Temporal boundary.
+    The blacklist, URL titles and file structure are saved next to the
+    manifest so batches and activities can pass their paths instead of
+    the data.
+    Small manifests are also returned inline as (url, content_file, title)
+    rows, so the workflow can slice batches without load_batch.
     """
 
     manifest_path: str
     total_docs: int
+    blacklist_path: Optional[str] = None
+    url_titles_path: Optional[str] = None
+    file_structure_path: Optional[str] = None
+    docs: Optional[List[Tuple[str, str, str]]] = None
 
 
 @dataclass
@@ -70,11 +95,22 @@ class SummarizeDocInput:
     llm_provider: str
     summary_prompt: str
     output_dir: str
-    blacklisted_urls: List[str] = field(default_factory=list)
-    url_titles: Dict[str, str] = field(default_factory=dict)
+    blacklist_path: Optional[str] = None
+    url_titles_path: Optional[str] = None
     output_format: str = "txt"
 
 
+@dataclass
+class SummarizeDocBatchInput:
+    """Input for the summarize_document_batch activity.
+
+    All items are summarized with the model, provider and blacklist of the first item.
+    """
+
+    items: List[SummarizeDocInput]
+    max_concurrency: int = 5
+
+
 @dataclass
 class SummarizeDocOutput:
     """Output from the summarize_document activity."""
@@ -118,6 +154,22 @@ class GenerateOutputInput:
     file_structure: Optional[List[str]] = None
     output_format: str = "txt"
     jsonl_entries: List[Dict[str, Any]] = field(default_factory=list)
+    # Summary filenames written by this execution. JSONL mode reads only these and
+    # structure-preserving mode reads them before scanning output_dir; None scans instead
+    summary_files: Optional[List[str]] = None
+    # Set on a resumed run: the first earlier_docs manifest documents were summarized
+    # before continue_as_new, and their filenames are looked up in the checkpoint log
+    manifest_path: Optional[str] = None
+    earlier_docs: int = 0
+    # Files saved by discover_urls, used alongside/instead of the inline fields above
+    blacklist_path: Optional[str] = None
+    file_structure_path: Optional[str] = None
+
+
+def _write_text(path: Union[str, Path], content: str) -> None:
+    """Write a text file (run via asyncio.to_thread to keep the event loop free)."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
 
 
 @activity.defn
@@ -129,10 +181,10 @@ async def discover_urls(input: DiscoverUrlsInput) -> DiscoverUrlsOutput:
     exceeding Temporal's payload size limit (~2MB). Returns only
     the manifest path and document count.
     """
-    from llmstxt_architect.extractor import bs4_extractor, default_extractor
-    from llmstxt_architect.loader import load_urls
+    from llmstxt_architect.extractor import bs4_extractor, default_extractor, html2text_extractor
+    from llmstxt_architect.loader import load_urls, normalize_url
 
-    extractor_map = {"default": default_extractor, "bs4": bs4_extractor}
+    extractor_map = {"default": default_extractor, "bs4": bs4_extractor, "html2text": html2text_extractor}
     extractor = extractor_map.get(input.extractor_name, default_extractor)
 
     activity.logger.info(f"Discovering URLs from {len(input.urls)} root URLs (max_depth={input.max_depth})")
@@ -146,45 +198,129 @@ async def discover_urls(input: DiscoverUrlsInput) -> DiscoverUrlsOutput:
 
     activity.logger.info(f"Discovered {len(docs)} documents")
 
+    # Crawls of overlapping roots can reach the same page under different
+    # spellings (trailing slash, fragment, case, default port); keep the first
+    # so each page is summarized once
+    seen_urls: set = set()
+    unique_docs = []
+    for doc in docs:
+        normalized_url = normalize_url(doc.metadata.get("source", ""))
+        if normalized_url not in seen_urls:
+            seen_urls.add(normalized_url)
+            unique_docs.append(doc)
+    if len(unique_docs) < len(docs):
+        activity.logger.info(f"Skipping {len(docs) - len(unique_docs)} duplicate URLs")
+    docs = unique_docs
+
     # Save document contents to staging files
     staging_dir = Path(input.project_dir) / ".staging"
     os.makedirs(staging_dir, exist_ok=True)
 
     manifest_entries: List[Dict[str, str]] = []
+    writes = []
     for doc in docs:
         source = doc.metadata.get("source", "")
         title = doc.metadata.get("title", "")
-        file_hash = hashlib.sha256(source.encode()).hexdigest()[:16]
+        # Staging filenames only need to be unique per run, so a 64-bit
+        # BLAKE2b digest is enough and cheaper than truncating SHA-256
+        file_hash = hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
         content_path = staging_dir / f"{file_hash}.txt"
-        with open(content_path, "w") as f:
-            f.write(doc.page_content)
+        writes.append(asyncio.to_thread(_write_text, content_path, doc.page_content))
         manifest_entries.append({"url": source, "title": title, "content_file": str(content_path)})
 
+    # Write all staging files concurrently on the default thread pool
+    await asyncio.gather(*writes)
+
     # Save manifest
-    manifest_path = staging_dir / "manifest.json"
-    with open(manifest_path, "w") as f:
-        json.dump(manifest_entries, f)
+    manifest_path = staging_dir / "manifest.jsonl"
+    manifest_size = _write_manifest(manifest_path, manifest_entries)
+
+    # Small manifests go back inline too, saving a load_batch round trip per batch
+    inline_docs: Optional[List[Tuple[str, str, str]]] = None
+    if manifest_size <= INLINE_MANIFEST_MAX_BYTES:
+        inline_docs = [(entry["url"], entry["content_file"], entry["title"]) for entry in manifest_entries]
+
+    # Save the blacklist and URL titles once, so batches pass paths instead of the data
+    blacklist_path = staging_dir / "blacklist.json"
+    url_titles_path = staging_dir / "url_titles.json"
+    with open(blacklist_path, "wb") as f:
+        f.write(orjson.dumps(input.blacklisted_urls))
+    with open(url_titles_path, "wb") as f:
+        f.write(orjson.dumps(input.url_titles))
+    file_structure_path = None
+    if input.file_structure is not None:
+        file_structure_path = staging_dir / "file_structure.json"
+        with open(file_structure_path, "wb") as f:
+            f.write(orjson.dumps(input.file_structure))
 
     activity.logger.info(f"Saved {len(manifest_entries)} documents to staging directory")
 
     return DiscoverUrlsOutput(
         manifest_path=str(manifest_path),
         total_docs=len(manifest_entries),
+        blacklist_path=str(blacklist_path),
+        url_titles_path=str(url_titles_path),
+        file_structure_path=str(file_structure_path) if file_structure_path else None,
+        docs=inline_docs,
     )
 
 
+def _offsets_path(manifest_path: Path) -> Path:
+    """Path of the line-offset index written next to a JSONL manifest."""
+    return manifest_path.with_suffix(".offsets")
+
+
+def _write_manifest(manifest_path: Path, entries: List[Dict[str, str]]) -> int:
+    """
+    Write manifest entries as JSON Lines plus a line-offset index.
+
+    The index holds the byte offset where each line starts followed by the
+    end-of-file offset, so load_batch can read just its slice instead of
+    parsing the whole manifest. Returns the manifest size in bytes.
+    """
+    offsets = array("Q", [0])
+    with open(manifest_path, "wb") as f:
+        for entry in entries:
+            line = orjson.dumps(entry) + b"\n"
+            f.write(line)
+            offsets.append(offsets[-1] + len(line))
+    with open(_offsets_path(manifest_path), "wb") as f:
+        offsets.tofile(f)
+    return offsets[-1]
+
+
+def _read_manifest_slice(manifest_path: str, start: int, end: int) -> List[Dict[str, str]]:
+    """Read manifest entries [start, end) using the offset index to seek straight to them."""
+    offsets_path = _offsets_path(Path(manifest_path))
+    itemsize = array("Q").itemsize
+    total = os.path.getsize(offsets_path) // itemsize - 1
+    start = max(0, min(start, total))
+    end = max(start, min(end, total))
+    if start == end:
+        return []
+
+    # Only the start offset of the first entry and the end offset of the last are needed
+    bounds = array("Q")
+    with open(offsets_path, "rb") as f:
+        f.seek(start * itemsize)
+        bounds.fromfile(f, end - start + 1)
+
+    with open(manifest_path, "rb") as f:
+        f.seek(bounds[0])
+        data = f.read(bounds[-1] - bounds[0])
+
+    return [orjson.loads(line) for line in data.splitlines()]
+
+
 @activity.defn
 async def load_batch(input: LoadBatchInput) -> LoadBatchOutput:
     """
     Load a batch slice of document metadata from the manifest.
 
-    Reads the manifest file and returns only the requested range,
-    keeping Temporal payloads small.
+    Seeks straight to the requested range of the JSONL manifest using its
+    offset index, keeping both the read and the Temporal payload small.
     """
-    with open(input.manifest_path, "r") as f:
-        manifest: List[Dict[str, str]] = json.load(f)
-
-    batch = manifest[input.batch_start : input.batch_end]
+    batch = _read_manifest_slice(input.manifest_path, input.batch_start, input.batch_end)
 
     return LoadBatchOutput(
         doc_urls=[entry["url"] for entry in batch],
@@ -221,37 +357,112 @@ Include technical terms, concepts, product names, and action verbs in keywords.
 Return valid JSON only, no markdown code blocks or extra text."""
 
 
-@activity.defn
-async def summarize_document(input: SummarizeDocInput) -> SummarizeDocOutput:
+@lru_cache(maxsize=16)
+def _get_llm(llm_name: str, llm_provider: str) -> Any:
     """
-    Summarize a single document using the configured LLM.
+    Get a chat model for the given model and provider, creating it once per worker.
 
-    This wraps the core summarization logic but operates on plain data
-    rather than Document objects.
+    The model and provider are fixed for a whole workflow, so every
+    summarize_document call can share one client instead of rebuilding it.
     """
-    from urllib.parse import urlparse
-
     from langchain.chat_models import init_chat_model
 
+    return init_chat_model(model=llm_name, model_provider=llm_provider)
+
+
+# Parsed checkpoint logs by path, with the (size, mtime_ns) they were read at
+_checkpoint_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
+
+def _load_checkpoint(log_file: Path) -> Dict[str, str]:
+    """
+    Load the checkpoint log of summarized URLs, re-parsing only when it changed.
+
+    Every summarized document checks the log, so the parsed mapping is cached
+    per worker process and invalidated by the file's size and mtime.
+    """
+    try:
+        stat = os.stat(log_file)
+    except FileNotFoundError:
+        return {}
+
+    stamp = (stat.st_size, stat.st_mtime_ns)
+    cached = _checkpoint_cache.get(str(log_file))
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(log_file, "rb") as f:
+        summarized_urls: Dict[str, str] = orjson.loads(f.read())
+    _checkpoint_cache[str(log_file)] = (stamp, summarized_urls)
+    return summarized_urls
+
+
+def _file_stamp(path: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Get a file's (size, mtime_ns), or None if there is no such file."""
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+@lru_cache(maxsize=16)
+def _read_blacklist(path: str, stamp: Tuple[int, int]) -> FrozenSet[str]:
+    """Parse a blacklist file; stamp is part of the cache key so a rewritten file is parsed again."""
+    with open(path, "rb") as f:
+        return frozenset(orjson.loads(f.read()))
+
+
+@lru_cache(maxsize=16)
+def _read_url_titles(path: str, stamp: Tuple[int, int]) -> Dict[str, str]:
+    """Parse a URL titles file; stamp is part of the cache key so a rewritten file is parsed again."""
+    with open(path, "rb") as f:
+        url_titles: Dict[str, str] = orjson.loads(f.read())
+    return url_titles
+
+
+def _load_blacklist(path: Optional[str]) -> FrozenSet[str]:
+    """
+    Load the blacklisted URLs saved by discover_urls.
+
+    Every summarized document needs the blacklist, so it is parsed once per
+    worker process and file version rather than shipped in each activity input.
+    """
+    stamp = _file_stamp(path)
+    return _read_blacklist(path, stamp) if stamp is not None else frozenset()
+
+
+def _load_url_titles(path: Optional[str]) -> Dict[str, str]:
+    """Load the URL titles saved by discover_urls (shared cached mapping, don't modify)."""
+    stamp = _file_stamp(path)
+    return _read_url_titles(path, stamp) if stamp is not None else {}
+
+
+def _check_already_done(input: SummarizeDocInput, blacklist: FrozenSet[str]) -> Optional[SummarizeDocOutput]:
+    """
+    Return a final output for documents that need no LLM call.
+
+    Covers blacklisted URLs and, for txt format, URLs already present in the
+    checkpoint log with their summary file on disk. Returns None otherwise.
+    """
     url = input.url
     normalized_url = url.rstrip("/")
 
     # Check if URL is blacklisted
-    if normalized_url in input.blacklisted_urls:
+    if normalized_url in blacklist:
         activity.logger.info(f"Skipping blacklisted URL: {url}")
         return SummarizeDocOutput(url=url, skipped=True)
 
     # Check if already summarized (checkpoint file exists) - only for txt format
     output_dir = Path(input.output_dir)
-    log_file = output_dir / "summarized_urls.json"
-    if input.output_format == "txt" and log_file.exists():
-        with open(log_file, "r") as f:
-            summarized_urls = json.load(f)
+    if input.output_format == "txt":
+        summarized_urls = _load_checkpoint(output_dir / "summarized_urls.json")
         if url in summarized_urls:
             summary_path = output_dir / summarized_urls[url]
             if summary_path.exists():
-                with open(summary_path, "r") as f:
-                    summary = f.read()
+                summary = _read_text(summary_path)
                 activity.logger.info(f"Already summarized: {url}")
                 return SummarizeDocOutput(
                     url=url,
@@ -259,102 +470,452 @@ async def summarize_document(input: SummarizeDocInput) -> SummarizeDocOutput:
                     filename=summarized_urls[url],
                 )
 
+    return None
+
+
+def _build_messages(input: SummarizeDocInput, content: str) -> List[Dict[str, str]]:
+    """Build the chat messages asking the LLM to summarize a document."""
+    # Use different prompt for JSONL format (wraps user prompt with JSON requirements)
+    if input.output_format == "jsonl":
+        prompt = build_jsonl_prompt(input.summary_prompt)
+    else:
+        prompt = input.summary_prompt
+
+    return [
+        {"role": "system", "content": prompt},
+        {
+            "role": "human",
+            "content": f"Summarize this content:\n\n{content}",
+        },
+    ]
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    """
+    Write a summary file unless the file on disk already holds exactly this content.
+
+    Re-runs mostly reproduce existing summaries, so a size check (from stat)
+    followed by a compare avoids rewriting them; any difference is written.
+    """
     try:
-        activity.logger.info(f"Summarizing: {url}")
+        if os.stat(path).st_size == len(content.encode("utf-8")):
+            with open(path, "r", encoding="utf-8") as f:
+                if f.read() == content:
+                    return
+    except (OSError, UnicodeDecodeError):
+        pass
 
-        # Read content from staging file
-        with open(input.content_file, "r") as f:
-            content = f.read()
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
 
-        llm = init_chat_model(model=input.llm_name, model_provider=input.llm_provider)
 
-        # Use different prompt for JSONL format (wraps user prompt with JSON requirements)
-        if input.output_format == "jsonl":
-            prompt = build_jsonl_prompt(input.summary_prompt)
-        else:
-            prompt = input.summary_prompt
-
-        summary_response = await llm.ainvoke(
-            [
-                {"role": "system", "content": prompt},
-                {
-                    "role": "human",
-                    "content": f"Summarize this content:\n\n{content}",
-                },
-            ]
+def _summary_filename(url: str) -> str:
+    """Get the summary filename for a URL, e.g. example.com_docs_page.txt."""
+    from urllib.parse import urlparse
+
+    parsed = urlparse(url)
+    filename = f"{parsed.netloc}{parsed.path}".replace("/", "_")
+    if not filename.endswith(".txt"):
+        filename += ".txt"
+    return filename
+
+
+def _save_summary(input: SummarizeDocInput, content: str, summary_text: str) -> SummarizeDocOutput:
+    """Format an LLM response, save it as the document's summary file and build the output."""
+    url = input.url
+    output_dir = Path(input.output_dir)
+
+    # Extract page title
+    url_titles = _load_url_titles(input.url_titles_path)
+    if url in url_titles:
+        title = url_titles[url]
+    else:
+        title = input.title or url.rpartition("/")[2]
+
+    filename = _summary_filename(url)
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    if input.output_format == "jsonl":
+        # Parse JSON response and build JSONL entry
+        try:
+            parsed_json = orjson.loads(summary_text.strip())
+            summary = parsed_json.get("summary", summary_text)
+            keywords = parsed_json.get("keywords", [])
+        except json.JSONDecodeError:
+            # Fallback if LLM didn't return valid JSON
+            summary = summary_text.replace("\n\n", " ").replace("\n", " ").strip()
+            keywords = []
+
+        # Save individual summary as JSON
+        entry = {
+            "url": url,
+            "content": content,
+            "summary": summary,
+            "keywords": keywords,
+        }
+        _write_if_changed(output_dir / filename, json.dumps(entry, ensure_ascii=False))
+
+        return SummarizeDocOutput(
+            url=url,
+            summary=summary,
+            filename=filename,
+            content=content,
+            keywords=keywords,
         )
+    else:
+        # Format summary for txt format
+        clean_summary = summary_text.replace("\n\n", " ").replace("\n", " ").strip()
+        formatted_summary = f"[{title}]({url}): {clean_summary}\n\n"
 
-        summary_text = summary_response.content
+        # Save individual summary
+        _write_if_changed(output_dir / filename, formatted_summary)
 
-        # Extract page title
-        if url in input.url_titles:
-            title = input.url_titles[url]
-        else:
-            title = input.title or url.split("/")[-1]
+        return SummarizeDocOutput(url=url, summary=formatted_summary, filename=filename)
 
-        # Generate filename
-        parsed = urlparse(url)
-        filename = f"{parsed.netloc}{parsed.path}".replace("/", "_")
-        if not filename.endswith(".txt"):
-            filename += ".txt"
 
-        os.makedirs(output_dir, exist_ok=True)
+def _chunk_text(content: Any) -> str:
+    """Get the text of a streamed message chunk, whose content may be a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block if isinstance(block, str) else block.get("text", "")
+        for block in content
+        if isinstance(block, str) or block.get("type") == "text"
+    )
 
-        if input.output_format == "jsonl":
-            # Parse JSON response and build JSONL entry
-            try:
-                parsed_json = json.loads(summary_text.strip())
-                summary = parsed_json.get("summary", summary_text)
-                keywords = parsed_json.get("keywords", [])
-            except json.JSONDecodeError:
-                # Fallback if LLM didn't return valid JSON
-                summary = summary_text.replace("\n\n", " ").replace("\n", " ").strip()
-                keywords = []
-
-            # Save individual summary as JSON
-            entry = {
-                "url": url,
-                "content": content,
-                "summary": summary,
-                "keywords": keywords,
-            }
-            with open(output_dir / filename, "w") as f:
-                f.write(json.dumps(entry, ensure_ascii=False))
-
-            return SummarizeDocOutput(
-                url=url,
-                summary=summary,
-                filename=filename,
-                content=content,
-                keywords=keywords,
-            )
-        else:
-            # Format summary for txt format
-            clean_summary = summary_text.replace("\n\n", " ").replace("\n", " ").strip()
-            formatted_summary = f"[{title}]({url}): {clean_summary}\n\n"
 
-            # Save individual summary
-            with open(output_dir / filename, "w") as f:
-                f.write(formatted_summary)
+# Seconds between heartbeats from a running summarize activity; well under the
+# workflow's heartbeat timeout so a single late tick doesn't fail the attempt
+_HEARTBEAT_INTERVAL = 10
+
+# Seconds a streamed LLM response may go without a chunk before the call is
+# treated as hung. The first chunk gets longer, since the model reads the
+# whole page before it starts answering
+_STREAM_IDLE_TIMEOUT = 30
+_FIRST_CHUNK_TIMEOUT = 120
+
+
+@asynccontextmanager
+async def _heartbeating(progress: Optional[Dict[str, str]] = None) -> AsyncIterator[None]:
+    """
+    Heartbeat periodically for as long as the block runs.
+
+    Heartbeats come from a background task rather than from the LLM stream,
+    so documents waiting on a concurrency slot, a slow time-to-first-token or
+    a provider that streams one final chunk don't look like a lost worker;
+    a stalled stream is caught by _stream_summary's idle timeout instead.
+    When progress is given, a snapshot of it is sent as the heartbeat details
+    so a retried attempt can pick it up.
+    """
+
+    async def _beat() -> None:
+        while True:
+            if progress is None:
+                activity.heartbeat()
+            else:
+                activity.heartbeat(dict(progress))
+            await asyncio.sleep(_HEARTBEAT_INTERVAL)
+
+    task = asyncio.create_task(_beat())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+        if progress is not None:
+            # Send the final progress too, in case the attempt is about to fail
+            activity.heartbeat(dict(progress))
+
+
+async def _stream_summary(llm: Any, messages: List[Dict[str, str]]) -> str:
+    """
+    Stream one summary from the LLM and join the chunks.
+
+    Raises asyncio.TimeoutError when the stream stalls, so a hung call fails
+    the attempt within seconds instead of waiting out start_to_close_timeout.
+    """
+    chunks: List[str] = []
+    stream = aiter(llm.astream(messages))
+    timeout = _FIRST_CHUNK_TIMEOUT
+    while True:
+        try:
+            chunk = await asyncio.wait_for(anext(stream), timeout)
+        except StopAsyncIteration:
+            break
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"No output from the LLM for {timeout}s") from None
+        chunks.append(_chunk_text(chunk.content))
+        timeout = _STREAM_IDLE_TIMEOUT
+    return "".join(chunks)
+
+
+@activity.defn
+async def summarize_document(input: SummarizeDocInput) -> SummarizeDocOutput:
+    """
+    Summarize a single document using the configured LLM.
+
+    This wraps the core summarization logic but operates on plain data
+    rather than Document objects.
+    """
+    done = _check_already_done(input, _load_blacklist(input.blacklist_path))
+    if done is not None:
+        return done
+
+    url = input.url
+    try:
+        activity.logger.info(f"Summarizing: {url}")
+
+        # Read content from staging file
+        content = _read_text(input.content_file)
+
+        # Stream the response so tokens are consumed as the provider produces
+        # them instead of waiting on one long request for the whole summary
+        llm = _get_llm(input.llm_name, input.llm_provider)
+        async with _heartbeating():
+            summary_text = await _stream_summary(llm, _build_messages(input, content))
 
-            return SummarizeDocOutput(url=url, summary=formatted_summary, filename=filename)
+        return _save_summary(input, content, summary_text)
 
+    except asyncio.TimeoutError:
+        # A stalled stream fails the attempt, so Temporal retries it
+        activity.logger.error(f"LLM stream stalled for {url}")
+        raise
     except Exception as e:
         activity.logger.error(f"Error summarizing {url}: {str(e)}")
         return SummarizeDocOutput(url=url, error=str(e))
 
 
+def _load_saved_summary(input: SummarizeDocInput, filename: str) -> Optional[SummarizeDocOutput]:
+    """Rebuild a document's output from the summary file an earlier attempt saved, if it's there."""
+    path = Path(input.output_dir) / filename
+    if not path.exists():
+        return None
+    if input.output_format == "jsonl":
+        entry = orjson.loads(_read_bytes(path))
+        return SummarizeDocOutput(
+            url=input.url,
+            summary=entry["summary"],
+            filename=filename,
+            content=entry["content"],
+            keywords=entry["keywords"],
+        )
+    return SummarizeDocOutput(url=input.url, summary=_read_text(path), filename=filename)
+
+
+@activity.defn
+async def summarize_document_batch(input: SummarizeDocBatchInput) -> List[SummarizeDocOutput]:
+    """
+    Summarize several documents in one activity with concurrent LLM calls.
+
+    The requests are streamed concurrently (bounded by max_concurrency)
+    without one Temporal activity per document, heartbeating while they
+    run. Failures are reported per document, like summarize_document, so
+    one bad page doesn't fail or retry the whole batch. Only a stalled LLM
+    stream fails the attempt; the retry reuses the documents already saved.
+    """
+    # Load the blacklist set once for the whole batch instead of per item
+    blacklist = _load_blacklist(input.items[0].blacklist_path) if input.items else frozenset()
+    outputs: List[Optional[SummarizeDocOutput]] = [
+        _check_already_done(item, blacklist) for item in input.items
+    ]
+
+    # URL -> summary filename for documents saved by this activity, sent as
+    # heartbeat details. A retried attempt reuses what earlier attempts saved
+    # instead of summarizing those documents again
+    progress: Dict[str, str] = {}
+    details = activity.info().heartbeat_details
+    saved: Dict[str, str] = details[0] if details else {}
+
+    # Read the content of every document that still needs an LLM call
+    pending: List[int] = []
+    contents: List[str] = []
+    for i, item in enumerate(input.items):
+        if outputs[i] is not None:
+            continue
+        try:
+            if item.url in saved:
+                outputs[i] = _load_saved_summary(item, saved[item.url])
+                if outputs[i] is not None:
+                    progress[item.url] = saved[item.url]
+                    continue
+            contents.append(_read_text(item.content_file))
+            pending.append(i)
+        except Exception as e:
+            activity.logger.error(f"Error summarizing {item.url}: {str(e)}")
+            outputs[i] = SummarizeDocOutput(url=item.url, error=str(e))
+
+    if pending:
+        first = input.items[pending[0]]
+        activity.logger.info(f"Summarizing batch of {len(pending)} documents")
+
+        llm = _get_llm(first.llm_name, first.llm_provider)
+        semaphore = asyncio.Semaphore(max(1, input.max_concurrency))
+
+        async def _summarize(item: SummarizeDocInput, content: str) -> SummarizeDocOutput:
+            """Summarize and save one pending document once a concurrency slot is free."""
+            try:
+                async with semaphore:
+                    summary_text = await _stream_summary(llm, _build_messages(item, content))
+                output = _save_summary(item, content, summary_text)
+            except asyncio.TimeoutError:
+                # A stalled stream fails the attempt, so Temporal retries it;
+                # documents saved so far are reused through the heartbeat details
+                activity.logger.error(f"LLM stream stalled for {item.url}")
+                raise
+            except Exception as e:
+                activity.logger.error(f"Error summarizing {item.url}: {str(e)}")
+                return SummarizeDocOutput(url=item.url, error=str(e))
+            if output.filename:
+                progress[item.url] = output.filename
+            return output
+
+        async with _heartbeating(progress):
+            tasks = [
+                asyncio.ensure_future(_summarize(input.items[i], content))
+                for i, content in zip(pending, contents)
+            ]
+            try:
+                results = await asyncio.gather(*tasks)
+            except asyncio.TimeoutError:
+                # Stop the other documents too, so the failed attempt doesn't
+                # keep streaming alongside its retry
+                for task in tasks:
+                    task.cancel()
+                raise
+
+        for i, result in zip(pending, results):
+            outputs[i] = result
+
+    return [output for output in outputs if output is not None]
+
+
 @activity.defn
 async def save_checkpoint(input: SaveCheckpointInput) -> None:
-    """Save the checkpoint log of summarized URLs."""
+    """
+    Merge newly summarized URLs into the checkpoint log.
+
+    The workflow sends only the URLs summarized since its last checkpoint, so
+    entries already in the log are kept and the new ones added or updated.
+    """
     output_dir = Path(input.output_dir)
     os.makedirs(output_dir, exist_ok=True)
     log_file = output_dir / "summarized_urls.json"
 
-    with open(log_file, "w") as f:
-        json.dump(input.summarized_urls, f, indent=2)
+    # Copy so the cached mapping isn't modified in place
+    summarized_urls = dict(_load_checkpoint(log_file))
+    summarized_urls.update(input.summarized_urls)
+
+    with open(log_file, "wb") as f:
+        f.write(orjson.dumps(summarized_urls, option=orjson.OPT_INDENT_2))
+
+    activity.logger.info(
+        f"Checkpoint saved: {len(input.summarized_urls)} new, {len(summarized_urls)} URLs logged"
+    )
+
+
+def _read_text(path: Union[str, Path]) -> str:
+    """Read a UTF-8 text file (run via asyncio.to_thread to keep the event loop free)."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read a file's raw bytes, for content that goes straight to orjson."""
+    return Path(path).read_bytes()
+
+
+# Characters read from the start of a summary file when only its URL is needed
+_SUMMARY_HEAD_CHARS = 4096
+
+
+def _read_summary_url(path: Path) -> Tuple[int, Optional[str]]:
+    """
+    Get a summary file's size and the URL of its "[title](url)" link.
+
+    Reads only the head of the file, where txt summaries put their link, and
+    falls back to the full file if the head has no match.
+    """
+    size = os.stat(path).st_size
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read(_SUMMARY_HEAD_CHARS)
+        match = _URL_PATTERN.search(text)
+        if match is None and len(text) == _SUMMARY_HEAD_CHARS:
+            match = _URL_PATTERN.search(text + f.read())
+    return size, match.group(2) if match else None
+
+
+# Files read per worker-thread task; grouping them keeps thousands of small
+# reads from each paying a thread-pool round trip
+_READ_CHUNK_SIZE = 64
+
+
+def _read_chunk(reader: Callable[[Path], Any], paths: List[Path]) -> List[Any]:
+    """Read a group of files in one thread, returning each result or the exception it raised."""
+    results: List[Any] = []
+    for path in paths:
+        try:
+            results.append(reader(path))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+async def _read_summary_files(
+    output_dir: Path,
+    output_file: str,
+    reader: Callable[[Path], Any] = _read_text,
+    filenames: Optional[List[str]] = None,
+) -> List[Tuple[str, Any]]:
+    """
+    Read summary files in output_dir concurrently.
+
+    Reads the given filenames, or every .txt file in output_dir if none are
+    given. Skips the output file itself; files that can't be read are logged
+    and left out. Returns (filename, reader result) pairs, by default the
+    full file content.
+    """
+    output_name = os.path.basename(output_file)
+    if filenames is None:
+        # scandir's entry type comes with the listing, so directories are
+        # skipped without a stat call per name
+        with os.scandir(output_dir) as entries:
+            filenames = [entry.name for entry in entries if entry.name.endswith(".txt") and entry.is_file()]
+    filenames = [name for name in filenames if name != output_name]
+
+    chunks = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                _read_chunk, reader, [output_dir / name for name in filenames[i : i + _READ_CHUNK_SIZE]]
+            )
+            for i in range(0, len(filenames), _READ_CHUNK_SIZE)
+        )
+    )
+
+    summary_files: List[Tuple[str, Any]] = []
+    for name, result in zip(filenames, (result for chunk in chunks for result in chunk)):
+        if isinstance(result, Exception):
+            activity.logger.warning(f"Error reading {name}: {result}")
+            continue
+        summary_files.append((name, result))
+    return summary_files
 
-    activity.logger.info(f"Checkpoint saved: {len(input.summarized_urls)} URLs logged")
+
+def _earlier_summary_files(output_dir: Path, manifest_path: str, earlier_docs: int) -> List[str]:
+    """
+    Get the summary filenames of the first earlier_docs manifest documents.
+
+    Earlier executions of a continued-as-new workflow recorded them in the
+    checkpoint log, so a resumed run reads the same files as one that never
+    continued as new.
+    """
+    summarized_urls = _load_checkpoint(output_dir / "summarized_urls.json")
+    filenames = []
+    for entry in _read_manifest_slice(manifest_path, 0, earlier_docs):
+        filename = summarized_urls.get(entry["url"])
+        if filename is not None:
+            filenames.append(filename)
+    return filenames
 
 
 @activity.defn
@@ -364,6 +925,19 @@ async def generate_output_file(input: GenerateOutputInput) -> str:
 
     Returns the path to the generated file.
     """
+    blacklist = frozenset(input.blacklisted_urls) | _load_blacklist(input.blacklist_path)
+    file_structure = input.file_structure
+    if file_structure is None and input.file_structure_path:
+        with open(input.file_structure_path, "rb") as f:
+            file_structure = orjson.loads(f.read())
+
+    summary_filenames = input.summary_files
+    if input.manifest_path and input.earlier_docs:
+        earlier_files = await asyncio.to_thread(
+            _earlier_summary_files, Path(input.output_dir), input.manifest_path, input.earlier_docs
+        )
+        summary_filenames = sorted(set(earlier_files).union(summary_filenames or []))
+
     if input.output_format == "jsonl":
         # JSONL format output - read entries from saved files on disk
         # (avoids passing large content through Temporal's gRPC boundary)
@@ -376,30 +950,27 @@ async def generate_output_file(input: GenerateOutputInput) -> str:
         activity.logger.info(f"Current working directory: {Path.cwd()}")
 
         if output_dir.exists():
-            all_files = os.listdir(output_dir)
-            txt_files = [f for f in all_files if f.endswith(".txt")]
-            activity.logger.info(f"Found {len(txt_files)} .txt files in {output_dir}")
+            # orjson parses bytes directly, so skip decoding the files to str.
+            # Reading only the files the workflow reported avoids parsing
+            # unrelated .txt files left in the directory
+            summary_files = await _read_summary_files(
+                output_dir, input.output_file, _read_bytes, summary_filenames
+            )
+            activity.logger.info(f"Found {len(summary_files)} .txt files in {output_dir}")
 
-            for filename in txt_files:
-                if filename == os.path.basename(input.output_file):
-                    continue
-                file_path = output_dir / filename
+            for filename, content in summary_files:
                 try:
-                    with open(file_path, "r") as f:
-                        content = f.read()
-                        # Try to parse as JSON (JSONL format saves as JSON)
-                        entry = json.loads(content)
-                        if isinstance(entry, dict) and "url" in entry:
-                            all_entries.append(entry)
-                        else:
-                            activity.logger.warning(
-                                f"File {filename} is not a valid JSONL entry (missing 'url' key)"
-                            )
+                    # Try to parse as JSON (JSONL format saves as JSON)
+                    entry = orjson.loads(content)
+                    if isinstance(entry, dict) and "url" in entry:
+                        all_entries.append(entry)
+                    else:
+                        activity.logger.warning(
+                            f"File {filename} is not a valid JSONL entry (missing 'url' key)"
+                        )
                 except json.JSONDecodeError as e:
                     # This file contains txt-format summary, not JSON - skip it
                     activity.logger.debug(f"Skipping {filename}: not valid JSON ({e})")
-                except Exception as e:
-                    activity.logger.warning(f"Error reading {filename}: {e}")
 
             activity.logger.info(f"Loaded {len(all_entries)} JSONL entries from disk")
         else:
@@ -412,7 +983,7 @@ async def generate_output_file(input: GenerateOutputInput) -> str:
         for entry in all_entries:
             url = entry.get("url", "").rstrip("/")
             # Skip blacklisted URLs
-            if url in input.blacklisted_urls:
+            if url in blacklist:
                 continue
             if url and url not in seen_urls:
                 seen_urls.add(url)
@@ -421,10 +992,12 @@ async def generate_output_file(input: GenerateOutputInput) -> str:
         # Sort by URL
         unique_entries.sort(key=lambda x: x.get("url", ""))
 
-        # Write JSONL output
-        with open(input.output_file, "w") as f:
-            for entry in unique_entries:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        # Write JSONL output in one call; json.dumps keeps the same separators
+        # as the local pipeline's llms.jsonl
+        _write_text(
+            input.output_file,
+            "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in unique_entries),
+        )
 
         activity.logger.info(
             f"Generated JSONL output file: {input.output_file} with {len(unique_entries)} entries"
@@ -432,79 +1005,77 @@ async def generate_output_file(input: GenerateOutputInput) -> str:
         return input.output_file
 
     # TXT format output (existing logic)
-    url_pattern = re.compile(r"\[(.*?)\]\((https?://[^\s)]+)\)")
-
-    if input.file_structure:
+    if file_structure:
         # Structure-preserving mode
         url_to_summary: Dict[str, str] = {}
         for summary in input.summaries:
-            match = url_pattern.search(summary)
+            match = _URL_PATTERN.search(summary)
             if match:
                 url_to_summary[match.group(2)] = summary.strip()
 
-        # Also check summary files in output dir
+        # Then the summary files this run wrote
         output_dir = Path(input.output_dir)
-        if output_dir.exists():
-            for filename in os.listdir(output_dir):
-                if filename.endswith(".txt") and filename != os.path.basename(input.output_file):
-                    file_path = output_dir / filename
-                    with open(file_path, "r") as f:
-                        content = f.read()
-                        match = url_pattern.search(content)
-                        if match:
-                            url = match.group(2)
-                            if url not in url_to_summary:
-                                url_to_summary[url] = content.strip()
+        if summary_filenames and output_dir.exists():
+            run_files = await _read_summary_files(output_dir, input.output_file, filenames=summary_filenames)
+            for _, content in run_files:
+                match = _URL_PATTERN.search(content)
+                if match and match.group(2) not in url_to_summary:
+                    url_to_summary[match.group(2)] = content.strip()
+
+        # URL of each line in the file structure, matched once for both passes below
+        line_urls = []
+        for line in file_structure:
+            match = _URL_PATTERN.search(line)
+            line_urls.append(match.group(2) if match else None)
+
+        # Only scan the output dir for summary files if some URL wasn't passed in
+        missing_urls = {url for url in line_urls if url is not None and url not in url_to_summary}
+        if missing_urls and output_dir.exists():
+            for _, content in await _read_summary_files(output_dir, input.output_file):
+                match = _URL_PATTERN.search(content)
+                if match:
+                    url = match.group(2)
+                    if url in missing_urls:
+                        url_to_summary[url] = content.strip()
+                        missing_urls.discard(url)
 
         output_lines = []
-        for line in input.file_structure:
-            match = url_pattern.search(line)
-            if match and match.group(2) in url_to_summary:
-                output_lines.append(url_to_summary[match.group(2)] + "\n")
+        for line, url in zip(file_structure, line_urls):
+            if url in url_to_summary:
+                output_lines.append(url_to_summary[url] + "\n")
             else:
                 output_lines.append(line)
 
-        with open(input.output_file, "w") as f:
-            f.writelines(output_lines)
+        _write_text(input.output_file, "".join(output_lines))
     else:
         # Sorted mode (same logic as Summarizer.generate_llms_txt)
-        summary_entries = []
         output_dir = Path(input.output_dir)
 
+        # Pick the longest file per normalized URL from each file's size and
+        # head, so only the files that end up in the output are read in full
+        best_by_url: Dict[str, Tuple[int, str]] = {}
         if output_dir.exists():
-            for filename in os.listdir(output_dir):
-                if filename.endswith(".txt") and filename != os.path.basename(input.output_file):
-                    file_path = output_dir / filename
-                    with open(file_path, "r") as f:
-                        content = f.read()
-                        match = url_pattern.search(content)
-                        url = match.group(2) if match else filename
-                        normalized_url = url.rstrip("/")
-                        if normalized_url not in input.blacklisted_urls:
-                            summary_entries.append((normalized_url, content))
-
-        # Deduplicate
-        url_to_entries: Dict[str, List[str]] = {}
-        for url, content in summary_entries:
-            url_to_entries.setdefault(url, []).append(content)
-
-        unique_entries_txt = []
-        for url, contents in url_to_entries.items():
-            contents.sort(key=len, reverse=True)
-            unique_entries_txt.append((url, contents[0]))
+            summary_urls = await _read_summary_files(output_dir, input.output_file, _read_summary_url)
+            for filename, (size, url) in summary_urls:
+                normalized_url = (url or filename).rstrip("/")
+                if normalized_url in blacklist:
+                    continue
+                current = best_by_url.get(normalized_url)
+                if current is None or size > current[0]:
+                    best_by_url[normalized_url] = (size, filename)
 
+        winners = [best_by_url[url][1] for url in sorted(best_by_url)]
+        summary_files = await _read_summary_files(output_dir, input.output_file, filenames=winners)
+
+        # Different URLs can still share identical content; keep the first in URL order
         seen_content: set = set()
-        final_entries = []
-        for url, content in unique_entries_txt:
+        parts: List[str] = []
+        for _, content in summary_files:
             if content not in seen_content:
-                final_entries.append((url, content))
                 seen_content.add(content)
+                parts.append(content)
 
-        sorted_entries = sorted(final_entries, key=lambda x: x[0])
-
-        with open(input.output_file, "w") as f:
-            for _, content in sorted_entries:
-                f.write(content)
+        _write_text(input.output_file, "".join(parts))
 
     activity.logger.info(f"Generated output file: {input.output_file}")
     return input.output_file
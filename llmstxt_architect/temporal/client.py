@@ -2,16 +2,56 @@
 Temporal client for starting workflows from the CLI.
 """
 
+import asyncio
 import os
 import time
 import uuid
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from temporalio.client import Client
 
 from llmstxt_architect.temporal import TASK_QUEUE
 from llmstxt_architect.temporal.workflows import CrawlAndSummarizeInput
 
+# Connected clients by server address, reused across calls in one process
+_clients: Dict[str, Client] = {}
+_clients_lock = asyncio.Lock()
+
+
+async def _get_client(temporal_address: str) -> Client:
+    """
+    Get a connected Temporal client, connecting on first use per address.
+
+    Args:
+        temporal_address: Temporal server address
+
+    Returns:
+        Shared client for that address
+    """
+    async with _clients_lock:
+        client = _clients.get(temporal_address)
+        if client is None:
+            print(f"Connecting to Temporal at {temporal_address}...")
+            client = await Client.connect(temporal_address)
+            _clients[temporal_address] = client
+        return client
+
+
+@lru_cache(maxsize=8)
+def _parse_file_structure(path: str, stamp: Tuple[int, int]) -> Tuple[str, ...]:
+    """Parse a local llms.txt file's structure; stamp is in the cache key so an edited file is reparsed."""
+    from llmstxt_architect.loader import parse_existing_llms_file
+
+    _, file_structure = parse_existing_llms_file(path)
+    return tuple(file_structure)
+
+
+def _read_blacklist_file(path: str) -> List[str]:
+    """Read a blacklist file into sorted, de-duplicated URLs, skipping blanks and comments."""
+    with open(path, "r") as f:
+        return sorted({url.rstrip("/") for line in f if (url := line.strip()) and not url.startswith("#")})
+
 
 async def run_temporal_workflow(
     urls: List[str],
@@ -53,12 +93,12 @@ async def run_temporal_workflow(
     Returns:
         Path to the generated output file
     """
-    # Load blacklisted URLs if file provided
+    # Load blacklisted URLs if file provided, off the event loop since large
+    # blacklists take a while to parse. Sorted so the workflow input is
+    # deterministic; activities turn it back into a set
     blacklisted_urls: List[str] = []
     if blacklist_file and os.path.exists(blacklist_file):
-        with open(blacklist_file, "r") as f:
-            lines = [line.strip() for line in f.readlines()]
-            blacklisted_urls = [url.rstrip("/") for url in lines if url and not url.startswith("#")]
+        blacklisted_urls = await asyncio.to_thread(_read_blacklist_file, blacklist_file)
 
     # Load file structure if preserving
     file_structure: Optional[List[str]] = None
@@ -74,9 +114,15 @@ async def run_temporal_workflow(
             file_lines = content.splitlines(True)
             _, file_structure = parse_existing_llms_file_content(file_lines)
         else:
-            from llmstxt_architect.loader import parse_existing_llms_file
-
-            _, file_structure = parse_existing_llms_file(existing_llms_file)
+            # Parsed off the event loop and cached per file version, so repeat
+            # runs against the same llms.txt skip the parse
+            try:
+                stat = os.stat(existing_llms_file)
+                stamp = (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                # parse_existing_llms_file reports the error and returns no structure
+                stamp = (0, 0)
+            file_structure = list(await asyncio.to_thread(_parse_file_structure, existing_llms_file, stamp))
 
     # Use default summary prompt if none provided
     if not summary_prompt:
@@ -91,8 +137,7 @@ async def run_temporal_workflow(
     # Create project directory
     os.makedirs(project_dir, exist_ok=True)
 
-    print(f"Connecting to Temporal at {temporal_address}...")
-    client = await Client.connect(temporal_address)
+    client = await _get_client(temporal_address)
 
     workflow_id = f"llmstxt-{uuid.uuid4().hex[:8]}"
     print(f"Starting workflow {workflow_id}...")
@@ -146,8 +191,7 @@ async def get_workflow_result(
     Returns:
         The workflow result (path to the generated output file)
     """
-    print(f"Connecting to Temporal at {temporal_address}...")
-    client = await Client.connect(temporal_address)
+    client = await _get_client(temporal_address)
 
     handle = client.get_workflow_handle(workflow_id)
 
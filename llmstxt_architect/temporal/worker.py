@@ -10,23 +10,60 @@ Run this to start a worker that hosts the workflows and activities:
 import argparse
 import asyncio
 import concurrent.futures
+import inspect
+import os
+from typing import Any, Callable, List
 
 from temporalio.client import Client
 from temporalio.worker import Worker
 
-from llmstxt_architect.temporal import TASK_QUEUE
+from llmstxt_architect.temporal import FAST_TASK_QUEUE, TASK_QUEUE
 from llmstxt_architect.temporal.activities import (
     discover_urls,
     generate_output_file,
     load_batch,
     save_checkpoint,
     summarize_document,
+    summarize_document_batch,
 )
 from llmstxt_architect.temporal.workflows import (
     BatchProcessWorkflow,
     CrawlAndSummarizeWorkflow,
 )
 
+# Long-running crawl and LLM activities, served on TASK_QUEUE alongside the workflows
+ACTIVITIES: List[Callable[..., Any]] = [
+    discover_urls,
+    summarize_document,
+    summarize_document_batch,
+]
+
+# Short bookkeeping activities, served on FAST_TASK_QUEUE
+FAST_ACTIVITIES: List[Callable[..., Any]] = [
+    load_batch,
+    save_checkpoint,
+    generate_output_file,
+]
+
+# Concurrent activities on FAST_TASK_QUEUE per worker; a few per running workflow is plenty
+FAST_ACTIVITY_SLOTS = 4
+
+# Overrides the worker thread pool size
+WORKER_THREADS_ENV = "LLMSTXT_WORKER_THREADS"
+
+
+def worker_threads() -> int:
+    """
+    Get the worker's thread pool size.
+
+    Activities mostly wait on file I/O, so the default is well above the CPU
+    count. Set LLMSTXT_WORKER_THREADS to tune it per deployment.
+    """
+    value = os.getenv(WORKER_THREADS_ENV)
+    if value:
+        return max(1, int(value))
+    return min(64, (os.cpu_count() or 4) * 8)
+
 
 async def run_worker(temporal_address: str = "localhost:7233") -> None:
     """
@@ -38,24 +75,36 @@ async def run_worker(temporal_address: str = "localhost:7233") -> None:
     print(f"Connecting to Temporal at {temporal_address}...")
     client = await Client.connect(temporal_address)
 
-    print(f"Starting worker on task queue: {TASK_QUEUE}")
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
+    print(f"Starting worker on task queues: {TASK_QUEUE}, {FAST_TASK_QUEUE}")
+
+    max_workers = worker_threads()
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="llmstxt-act"
+    ) as executor:
+        # The pool backs asyncio.to_thread calls made inside activities
+        asyncio.get_running_loop().set_default_executor(executor)
+        # Async activities run on the event loop; Temporal only needs an
+        # activity executor for sync ones, so skip it when there are none
+        has_sync_activities = any(not inspect.iscoroutinefunction(fn) for fn in ACTIVITIES + FAST_ACTIVITIES)
+        activity_executor = executor if has_sync_activities else None
         worker = Worker(
             client,
             task_queue=TASK_QUEUE,
             workflows=[CrawlAndSummarizeWorkflow, BatchProcessWorkflow],
-            activities=[
-                discover_urls,
-                load_batch,
-                summarize_document,
-                save_checkpoint,
-                generate_output_file,
-            ],
-            activity_executor=executor,
+            activities=ACTIVITIES,
+            activity_executor=activity_executor,
+        )
+        # Separate worker so checkpoints and manifest loads never queue
+        # behind LLM calls for an activity slot
+        fast_worker = Worker(
+            client,
+            task_queue=FAST_TASK_QUEUE,
+            activities=FAST_ACTIVITIES,
+            activity_executor=activity_executor,
+            max_concurrent_activities=FAST_ACTIVITY_SLOTS,
         )
         print("Worker started. Ctrl+C to stop.")
-        await worker.run()
+        await asyncio.gather(worker.run(), fast_worker.run())
 
 
 def parse_args() -> argparse.Namespace:
@@ -6,30 +6,106 @@ entire pipeline. It uses child workflows (BatchProcessWorkflow) to process
 documents in batches, keeping event histories small.
 """
 
+import asyncio
+import math
 from dataclasses import dataclass, field
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
 
 with workflow.unsafe.imports_passed_through():
+    from llmstxt_architect.temporal import FAST_TASK_QUEUE
     from llmstxt_architect.temporal.activities import (
         DiscoverUrlsInput,
         GenerateOutputInput,
         LoadBatchInput,
         SaveCheckpointInput,
+        SummarizeDocBatchInput,
         SummarizeDocInput,
         SummarizeDocOutput,
         discover_urls,
         generate_output_file,
         load_batch,
         save_checkpoint,
-        summarize_document,
+        summarize_document_batch,
     )
 
 
-BATCH_SIZE = 10
+# Minimum documents per BatchProcessWorkflow child. Larger batches mean fewer
+# children and less fixed start/complete overhead in the parent's history,
+# at the cost of a longer history in each child
+BATCH_SIZE = 50
+
+# Documents summarized per summarize_document_batch activity
+SUMMARIZE_CHUNK_SIZE = 10
+
+# Longest gap between heartbeats before a summarize activity's worker is
+# treated as lost and the activity retried, instead of waiting out
+# start_to_close_timeout. The activity heartbeats every few seconds while it
+# runs, and fails the attempt itself when an LLM stream stalls
+SUMMARIZE_HEARTBEAT_TIMEOUT = timedelta(seconds=60)
+
+# Total time per round of concurrent documents in a summarize_document_batch
+# chunk, across all retries, before the chunk is given up on
+SUMMARIZE_TIME_BUDGET = timedelta(minutes=8)
+
+# Batch child workflows in flight at once; the second one lets the next batch
+# start while the previous child waits on its slowest document. They split
+# max_concurrent_summaries between them
+MAX_CONCURRENT_BATCHES = 2
+
+# Completed batches between checkpoint writes by the parent workflow
+CHECKPOINT_EVERY = 5
+
+# Parent history events per batch: the load_batch activity, the child
+# workflow and the workflow tasks around them
+EVENTS_PER_BATCH = 12
+
+# Parent history events to spend before continuing as new, leaving headroom
+# under Temporal's 50K event limit
+MAX_HISTORY_EVENTS = 40_000
+
+
+def batch_size_for(max_concurrent_summaries: int) -> int:
+    """Documents per child workflow: one summarize_document_batch chunk per concurrent summary."""
+    return max(BATCH_SIZE, max_concurrent_summaries * SUMMARIZE_CHUNK_SIZE)
+
+
+def concurrent_batches_for(max_concurrent_summaries: int) -> int:
+    """Batch child workflows in flight at once; never more than the LLM calls they share."""
+    return max(1, min(MAX_CONCURRENT_BATCHES, max_concurrent_summaries))
+
+
+def chunk_concurrency_for(max_concurrent_summaries: int) -> Tuple[int, int]:
+    """
+    Split one child's LLM call budget into (chunk activities in flight, calls per chunk).
+
+    A chunk holds at most SUMMARIZE_CHUNK_SIZE documents, so it never gets more
+    calls than that, and the two multiplied never exceed the budget.
+    """
+    budget = max(1, max_concurrent_summaries)
+    chunks = math.ceil(budget / SUMMARIZE_CHUNK_SIZE)
+    return chunks, budget // chunks
+
+
+@dataclass
+class ResumeState:
+    """
+    Where a continued-as-new CrawlAndSummarizeWorkflow picks up.
+
+    Everything large (documents, blacklist, titles, file structure) is
+    already on disk from the first run's discover_urls, so only paths and
+    the next batch offset are carried across continue_as_new.
+    """
+
+    manifest_path: str
+    total_docs: int
+    batch_start: int
+    blacklist_path: Optional[str] = None
+    url_titles_path: Optional[str] = None
+    file_structure_path: Optional[str] = None
 
 
 @dataclass
@@ -53,23 +129,20 @@ class CrawlAndSummarizeInput:
     blacklisted_urls: List[str] = field(default_factory=list)
     url_titles: Dict[str, str] = field(default_factory=dict)
     file_structure: Optional[List[str]] = None
+    # Set when continuing as new; discovery is skipped and batches resume here
+    resume: Optional[ResumeState] = None
 
 
 @dataclass
 class BatchProcessInput:
-    """Input for a batch processing child workflow."""
-
-    doc_urls: List[str]
-    doc_content_files: List[str]
-    doc_titles: List[str]
-    llm_name: str
-    llm_provider: str
-    summary_prompt: str
-    output_dir: str
-    blacklisted_urls: List[str] = field(default_factory=list)
-    url_titles: Dict[str, str] = field(default_factory=dict)
+    """Input for a batch processing child workflow.
+
+    The parent builds one SummarizeDocInput per document, so the child
+    passes them straight to the summarize activities.
+    """
+
+    tasks: List[SummarizeDocInput]
     max_concurrent_summaries: int = 5
-    output_format: str = "txt"
 
 
 @dataclass
@@ -84,11 +157,14 @@ class JsonlEntryData:
 
 @dataclass
 class BatchProcessOutput:
-    """Output from a batch processing child workflow."""
+    """Output from a batch processing child workflow.
+
+    Only (url, filename) pairs are returned; the summaries themselves are
+    read back from disk by generate_output_file, keeping them out of the
+    parent's history.
+    """
 
-    summaries: List[str]
-    summarized_urls: Dict[str, str]
-    jsonl_entries: List[Dict[str, Any]] = field(default_factory=list)
+    summarized_urls: List[Tuple[str, str]]
 
 
 @workflow.defn
@@ -97,73 +173,61 @@ class BatchProcessWorkflow:
     Child workflow that processes a batch of documents.
 
     Each batch gets its own event history to stay under the 50K event limit.
-    Documents within a batch are summarized concurrently.
+    Documents within a batch are summarized concurrently, up to
+    max_concurrent_summaries LLM calls at a time.
     """
 
     @workflow.run
     async def run(self, input: BatchProcessInput) -> BatchProcessOutput:
         """Process a batch of documents."""
-        summaries: List[str] = []
-        summarized_urls: Dict[str, str] = {}
-        # JSONL entries are saved to disk during summarization, not returned here
-
-        # Create activity inputs for all docs in the batch
-        tasks = []
-        for url, content_file, title in zip(input.doc_urls, input.doc_content_files, input.doc_titles):
-            task_input = SummarizeDocInput(
-                url=url,
-                content_file=content_file,
-                title=title,
-                llm_name=input.llm_name,
-                llm_provider=input.llm_provider,
-                summary_prompt=input.summary_prompt,
-                output_dir=input.output_dir,
-                blacklisted_urls=input.blacklisted_urls,
-                url_titles=input.url_titles,
-                output_format=input.output_format,
-            )
-            tasks.append(
-                workflow.execute_activity(
-                    summarize_document,
-                    task_input,
-                    start_to_close_timeout=timedelta(minutes=5),
+        summarized_urls: List[Tuple[str, str]] = []
+        # Summaries and JSONL entries are saved to disk during summarization, not returned here
+
+        # Each chunk activity sends up to chunk_concurrency requests at once, so
+        # only run enough chunks to stay within max_concurrent_summaries
+        max_chunks, chunk_concurrency = chunk_concurrency_for(input.max_concurrent_summaries)
+        chunk_semaphore = asyncio.Semaphore(max_chunks)
+
+        async def _summarize_chunk(chunk: List[SummarizeDocInput]) -> List[SummarizeDocOutput]:
+            """Summarize one chunk of documents once a concurrency slot is free."""
+            # The chunk's documents run chunk_concurrency at a time, so it takes
+            # as many rounds as that, not one round per document
+            rounds = math.ceil(len(chunk) / chunk_concurrency)
+            async with chunk_semaphore:
+                return await workflow.execute_activity(
+                    summarize_document_batch,
+                    SummarizeDocBatchInput(items=chunk, max_concurrency=chunk_concurrency),
+                    start_to_close_timeout=timedelta(minutes=5) * rounds,
+                    # Retries are bounded by total time rather than attempt count,
+                    # so a flaky endpoint can't stretch one chunk to 3 full attempts
+                    schedule_to_close_timeout=SUMMARIZE_TIME_BUDGET * rounds,
+                    heartbeat_timeout=SUMMARIZE_HEARTBEAT_TIMEOUT,
                     retry_policy=RetryPolicy(
                         initial_interval=timedelta(seconds=2),
-                        maximum_interval=timedelta(seconds=30),
-                        maximum_attempts=3,
+                        maximum_interval=timedelta(seconds=60),
+                        maximum_attempts=10,
                         backoff_coefficient=2.0,
+                        non_retryable_error_types=["ValueError", "KeyError"],
                     ),
                 )
-            )
-
-        # Execute all activities in the batch concurrently
-        import asyncio
 
-        results: List[SummarizeDocOutput] = await asyncio.gather(*tasks)
+        # One activity per chunk of documents; its LLM calls are streamed concurrently
+        chunk_results: List[List[SummarizeDocOutput]] = await asyncio.gather(
+            *(
+                _summarize_chunk(input.tasks[chunk_start : chunk_start + SUMMARIZE_CHUNK_SIZE])
+                for chunk_start in range(0, len(input.tasks), SUMMARIZE_CHUNK_SIZE)
+            )
+        )
+        results = [result for chunk_result in chunk_results for result in chunk_result]
 
         for result in results:
             if result.summary and result.filename:
-                summaries.append(result.summary)
-                summarized_urls[result.url] = result.filename
-                # JSONL entries are saved to disk in the activity, not collected here
+                summarized_urls.append((result.url, result.filename))
             elif result.error:
                 workflow.logger.warning(f"Failed to summarize {result.url}: {result.error}")
 
-        # Save checkpoint after batch
-        await workflow.execute_activity(
-            save_checkpoint,
-            SaveCheckpointInput(
-                output_dir=input.output_dir,
-                summarized_urls=summarized_urls,
-            ),
-            start_to_close_timeout=timedelta(seconds=30),
-        )
-
-        return BatchProcessOutput(
-            summaries=summaries,
-            summarized_urls=summarized_urls,
-            # jsonl_entries are read from disk, not passed through workflow
-        )
+        # The parent checkpoints summarized_urls every few batches
+        return BatchProcessOutput(summarized_urls=summarized_urls)
 
 
 @workflow.defn
@@ -185,117 +249,206 @@ class CrawlAndSummarizeWorkflow:
         summaries_path = f"{input.project_dir}/{input.output_dir}"
         output_file_path = f"{input.project_dir}/{input.output_file}"
 
-        workflow.logger.info(f"Starting crawl-and-summarize workflow for {len(input.urls)} URLs")
+        inline_docs = None
+        if input.resume is None:
+            workflow.logger.info(f"Starting crawl-and-summarize workflow for {len(input.urls)} URLs")
 
-        # Phase 1: Discover URLs (saves content to disk, returns manifest path)
-        discover_output = await workflow.execute_activity(
-            discover_urls,
-            DiscoverUrlsInput(
-                urls=input.urls,
-                project_dir=input.project_dir,
-                max_depth=input.max_depth,
-                extractor_name=input.extractor_name,
-                existing_llms_file=input.existing_llms_file,
-            ),
-            start_to_close_timeout=timedelta(minutes=30),
-            retry_policy=RetryPolicy(
-                initial_interval=timedelta(seconds=5),
-                maximum_interval=timedelta(minutes=2),
-                maximum_attempts=3,
-            ),
-        )
+            # Phase 1: Discover URLs (saves content, blacklist, titles and file
+            # structure to disk, returns their paths)
+            discover_output = await workflow.execute_activity(
+                discover_urls,
+                DiscoverUrlsInput(
+                    urls=input.urls,
+                    project_dir=input.project_dir,
+                    max_depth=input.max_depth,
+                    extractor_name=input.extractor_name,
+                    existing_llms_file=input.existing_llms_file,
+                    blacklisted_urls=input.blacklisted_urls,
+                    url_titles=input.url_titles,
+                    file_structure=input.file_structure,
+                ),
+                start_to_close_timeout=timedelta(minutes=30),
+                retry_policy=RetryPolicy(
+                    initial_interval=timedelta(seconds=5),
+                    maximum_interval=timedelta(minutes=2),
+                    maximum_attempts=3,
+                ),
+            )
+            resume = ResumeState(
+                manifest_path=discover_output.manifest_path,
+                total_docs=discover_output.total_docs,
+                batch_start=0,
+                blacklist_path=discover_output.blacklist_path,
+                url_titles_path=discover_output.url_titles_path,
+                file_structure_path=discover_output.file_structure_path,
+            )
+            inline_docs = discover_output.docs
+            workflow.logger.info(f"Discovered {resume.total_docs} documents to summarize")
+        else:
+            resume = input.resume
+            workflow.logger.info(f"Resuming at document {resume.batch_start} of {resume.total_docs}")
 
-        total_docs = discover_output.total_docs
-        manifest_path = discover_output.manifest_path
-        workflow.logger.info(f"Discovered {total_docs} documents to summarize")
+        total_docs = resume.total_docs
+        manifest_path = resume.manifest_path
 
         # Phase 2: Process documents in batches via child workflows
-        all_summaries: List[str] = []
         all_summarized_urls: Dict[str, str] = {}
-        # Note: JSONL entries are saved to disk during summarization and read back
-        # in generate_output_file to avoid exceeding Temporal's gRPC message size limit
+        # Note: summaries and JSONL entries are saved to disk during summarization and
+        # read back in generate_output_file to avoid exceeding Temporal's gRPC message size limit
+
+        # Safety valve: only as many batches as fit the parent's event budget run
+        # in this execution; the rest continue as new to stay under the 50K
+        # event limit on the parent workflow
+        batch_size = batch_size_for(input.max_concurrent_summaries)
+        max_batches = MAX_HISTORY_EVENTS // EVENTS_PER_BATCH
+        batch_ranges: List[Tuple[int, int]] = []
+        for batch_start in range(resume.batch_start, total_docs, batch_size):
+            if len(batch_ranges) >= max_batches:
+                break
+            batch_ranges.append((batch_start, min(batch_start + batch_size, total_docs)))
+
+        # Only a couple of children overlap, and they split the LLM call budget
+        # so together they stay within max_concurrent_summaries. One more batch
+        # than that may hold a pipeline slot, so its manifest slice is loaded
+        # while it waits for a child slot and load_batch stays off the critical path
+        concurrent_batches = concurrent_batches_for(input.max_concurrent_summaries)
+        batch_semaphore = asyncio.Semaphore(concurrent_batches)
+        pipeline_semaphore = asyncio.Semaphore(concurrent_batches + 1)
+
+        # URLs summarized since the last checkpoint; save_checkpoint merges them
+        # into the log on disk, so each write only carries the new entries
+        pending_checkpoint: Dict[str, str] = {}
+        checkpoint_lock = asyncio.Lock()
+        completed_batches = 0
+
+        async def _flush_checkpoint() -> None:
+            """Merge the URLs summarized since the last checkpoint into the log on disk."""
+            async with checkpoint_lock:
+                if not pending_checkpoint:
+                    return
+                delta = dict(pending_checkpoint)
+                pending_checkpoint.clear()
+                await workflow.execute_activity(
+                    save_checkpoint,
+                    SaveCheckpointInput(output_dir=summaries_path, summarized_urls=delta),
+                    task_queue=FAST_TASK_QUEUE,
+                    start_to_close_timeout=timedelta(seconds=30),
+                )
 
-        for batch_start in range(0, total_docs, BATCH_SIZE):
-            batch_end = min(batch_start + BATCH_SIZE, total_docs)
+        async def _process_batch(batch_start: int, batch_end: int) -> BatchProcessOutput:
+            """Load one batch from the manifest and summarize it in a child workflow."""
+            async with pipeline_semaphore:
+                if inline_docs is not None:
+                    # Small crawls come back inline from discover_urls; slice them here
+                    batch_docs = inline_docs[batch_start:batch_end]
+                else:
+                    # Load batch metadata from manifest (small payload)
+                    batch_data = await workflow.execute_activity(
+                        load_batch,
+                        LoadBatchInput(
+                            manifest_path=manifest_path,
+                            batch_start=batch_start,
+                            batch_end=batch_end,
+                        ),
+                        task_queue=FAST_TASK_QUEUE,
+                        start_to_close_timeout=timedelta(seconds=30),
+                    )
+                    batch_docs = list(
+                        zip(batch_data.doc_urls, batch_data.doc_content_files, batch_data.doc_titles)
+                    )
+
+                batch_input = BatchProcessInput(
+                    tasks=[
+                        SummarizeDocInput(
+                            url=url,
+                            content_file=content_file,
+                            title=title,
+                            llm_name=input.llm_name,
+                            llm_provider=input.llm_provider,
+                            summary_prompt=input.summary_prompt,
+                            output_dir=summaries_path,
+                            blacklist_path=resume.blacklist_path,
+                            url_titles_path=resume.url_titles_path,
+                            output_format=input.output_format,
+                        )
+                        for url, content_file, title in batch_docs
+                    ],
+                    max_concurrent_summaries=input.max_concurrent_summaries // concurrent_batches,
+                )
 
-            # Load batch metadata from manifest (small payload)
-            batch_data = await workflow.execute_activity(
-                load_batch,
-                LoadBatchInput(
-                    manifest_path=manifest_path,
-                    batch_start=batch_start,
-                    batch_end=batch_end,
-                ),
-                start_to_close_timeout=timedelta(seconds=30),
-            )
+                async with batch_semaphore:
+                    batch_output = await workflow.execute_child_workflow(
+                        BatchProcessWorkflow.run,
+                        batch_input,
+                        id=f"batch-{batch_start}-{batch_end}",
+                    )
 
-            batch_input = BatchProcessInput(
-                doc_urls=batch_data.doc_urls,
-                doc_content_files=batch_data.doc_content_files,
-                doc_titles=batch_data.doc_titles,
-                llm_name=input.llm_name,
-                llm_provider=input.llm_provider,
-                summary_prompt=input.summary_prompt,
-                output_dir=summaries_path,
-                blacklisted_urls=input.blacklisted_urls,
-                url_titles=input.url_titles,
-                max_concurrent_summaries=input.max_concurrent_summaries,
-                output_format=input.output_format,
+            workflow.logger.info(
+                f"Batch {batch_start}-{batch_end} complete: {len(batch_output.summarized_urls)} summaries"
             )
 
-            batch_output = await workflow.execute_child_workflow(
-                BatchProcessWorkflow.run,
-                batch_input,
-                id=f"batch-{batch_start}-{batch_end}",
-            )
+            # Checkpoint every CHECKPOINT_EVERY batches instead of after each one
+            nonlocal completed_batches
+            completed_batches += 1
+            pending_checkpoint.update(batch_output.summarized_urls)
+            if completed_batches % CHECKPOINT_EVERY == 0:
+                await _flush_checkpoint()
+            return batch_output
 
-            all_summaries.extend(batch_output.summaries)
+        batch_outputs = await asyncio.gather(*(_process_batch(start, end) for start, end in batch_ranges))
+        await _flush_checkpoint()
+
+        # Merge in batch order so the collected URLs keep the manifest order
+        for batch_output in batch_outputs:
             all_summarized_urls.update(batch_output.summarized_urls)
-            # JSONL entries are read from disk, not passed through workflow
 
-            workflow.logger.info(
-                f"Batch {batch_start}-{batch_end} complete: {len(batch_output.summaries)} summaries"
+        processed_docs = batch_ranges[-1][1] if batch_ranges else total_docs
+        if processed_docs < total_docs:
+            workflow.logger.info(f"Continuing as new after {processed_docs} documents")
+            # Carry only scalars and paths; the URL lists, blacklist, titles and
+            # file structure are already on disk
+            remaining_input = CrawlAndSummarizeInput(
+                urls=[],
+                llm_name=input.llm_name,
+                llm_provider=input.llm_provider,
+                summary_prompt=input.summary_prompt,
+                project_dir=input.project_dir,
+                output_dir=input.output_dir,
+                output_file=input.output_file,
+                output_format=input.output_format,
+                max_concurrent_summaries=input.max_concurrent_summaries,
+                resume=ResumeState(
+                    manifest_path=manifest_path,
+                    total_docs=total_docs,
+                    batch_start=processed_docs,
+                    blacklist_path=resume.blacklist_path,
+                    url_titles_path=resume.url_titles_path,
+                    file_structure_path=resume.file_structure_path,
+                ),
             )
-
-            # Safety valve: continue_as_new if we've processed many batches
-            # to avoid hitting the 50K event limit on the parent workflow
-            if batch_end < total_docs and batch_end >= 500:
-                workflow.logger.info(f"Continuing as new after {batch_end} documents")
-                remaining_input = CrawlAndSummarizeInput(
-                    urls=input.urls,
-                    max_depth=0,
-                    llm_name=input.llm_name,
-                    llm_provider=input.llm_provider,
-                    summary_prompt=input.summary_prompt,
-                    project_dir=input.project_dir,
-                    output_dir=input.output_dir,
-                    output_file=input.output_file,
-                    output_format=input.output_format,
-                    blacklist_file=input.blacklist_file,
-                    extractor_name=input.extractor_name,
-                    existing_llms_file=input.existing_llms_file,
-                    update_descriptions_only=input.update_descriptions_only,
-                    max_concurrent_summaries=input.max_concurrent_summaries,
-                    blacklisted_urls=input.blacklisted_urls,
-                    url_titles=input.url_titles,
-                    file_structure=input.file_structure,
-                )
-                workflow.continue_as_new(remaining_input)
+            workflow.continue_as_new(remaining_input)
 
         # Phase 3: Generate final output file
-        # Note: JSONL entries are read from disk in the activity, not passed here
+        # Note: summaries are read from disk in the activity, not passed here;
+        # only the filenames summarized in this execution are sent. Those from
+        # before continue_as_new are looked up in the checkpoint log by the activity
+        summary_files = sorted(set(all_summarized_urls.values()))
         output_path = await workflow.execute_activity(
             generate_output_file,
             GenerateOutputInput(
-                summaries=all_summaries,
+                summaries=[],
                 output_file=output_file_path,
                 output_dir=summaries_path,
-                blacklisted_urls=input.blacklisted_urls,
-                file_structure=input.file_structure,
                 output_format=input.output_format,
+                summary_files=summary_files,
+                manifest_path=manifest_path,
+                earlier_docs=resume.batch_start,
+                blacklist_path=resume.blacklist_path,
+                file_structure_path=resume.file_structure_path,
             ),
+            task_queue=FAST_TASK_QUEUE,
             start_to_close_timeout=timedelta(minutes=5),
         )
 
-        workflow.logger.info(f"Workflow complete: {len(all_summaries)} summaries -> {output_path}")
+        workflow.logger.info(f"Workflow complete: {len(all_summarized_urls)} summaries -> {output_path}")
         return output_path
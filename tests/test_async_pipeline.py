@@ -12,6 +12,7 @@ Verifies that:
 """
 
 import inspect
+import os
 import sys
 
 
@@ -153,6 +154,81 @@ def test_loader_extractor_to_thread():
         return False
 
 
+def test_extractor_process_pool():
+    """Verify large pages from built-in extractors can run in the process pool."""
+    try:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        from llmstxt_architect.extractor import (
+            PROCESS_SAFE_EXTRACTORS,
+            bs4_extractor,
+            default_extractor,
+            discard_process_pool,
+            get_process_pool,
+            shutdown_process_pool,
+        )
+        from llmstxt_architect.loader import fetch_url
+
+        assert default_extractor in PROCESS_SAFE_EXTRACTORS
+        assert bs4_extractor in PROCESS_SAFE_EXTRACTORS
+
+        pool = get_process_pool()
+        assert isinstance(pool, ProcessPoolExecutor)
+        assert get_process_pool() is pool, "Process pool should be created once"
+
+        source = inspect.getsource(fetch_url)
+        assert "run_in_executor" in source, "run_in_executor not found in fetch_url"
+        assert "BrokenProcessPool" in source, "fetch_url should fall back when a worker dies"
+
+        # Extractors must survive the round trip to a worker process
+        html = "<html><body><article class='md-content__inner'><p>Hello</p></article></body></html>"
+        try:
+            assert pool.submit(bs4_extractor, html).result(timeout=60) == "Hello"
+        finally:
+            shutdown_process_pool()
+        assert get_process_pool() is not pool, "Pool should be recreated after shutdown"
+
+        # A dead worker breaks the pool; discarding it lets the next page get a fresh one
+        broken = get_process_pool()
+        try:
+            broken.submit(os._exit, 1).result(timeout=60)
+        except BrokenProcessPool:
+            pass
+        discard_process_pool(broken)
+        assert get_process_pool() is not broken, "Broken pool should be replaced"
+        shutdown_process_pool()
+
+        print("  Extractor process pool test passed!")
+        return True
+    except Exception as e:
+        print(f"  Extractor process pool test failed: {e}")
+        return False
+
+
+def test_loader_normalize_url():
+    """Verify normalize_url treats fragment, case, trailing slash and default port variants as one URL."""
+    try:
+        from llmstxt_architect.loader import normalize_url
+
+        expected = "https://example.com/docs"
+        for url in [
+            "https://example.com/docs",
+            "https://example.com/docs/",
+            "https://Example.com/Docs#intro",
+            "https://example.com:443/docs/",
+        ]:
+            assert normalize_url(url) == expected, f"{url} -> {normalize_url(url)}"
+        assert normalize_url("https://example.com:8443/docs") == "https://example.com:8443/docs"
+        assert normalize_url("http://example.com:80") == "http://example.com"
+
+        print("  Normalize URL test passed!")
+        return True
+    except Exception as e:
+        print(f"  Normalize URL test failed: {e}")
+        return False
+
+
 def test_main_threads_concurrency_params():
     """Verify generate_llms_txt accepts both concurrency params."""
     try:
@@ -195,30 +271,45 @@ def test_summarizer_write_read_helpers():
 
 def run_tests():
     """Run all async pipeline tests."""
-    results = {}
-
-    print("\nSummarizer async tests:")
-    results["ainvoke"] = test_summarizer_uses_ainvoke()
-    results["async_file_io"] = test_summarizer_async_file_io()
-    results["log_lock"] = test_summarizer_has_log_lock()
-    results["concurrent_summarize"] = test_summarizer_concurrent_summarize_all()
-    results["summarizer_param"] = test_summarizer_max_concurrent_param()
-    results["write_read_helpers"] = test_summarizer_write_read_helpers()
-
-    print("\nLoader async tests:")
-    results["concurrent_crawl"] = test_loader_concurrent_crawling()
-    results["loader_param"] = test_loader_max_concurrent_param()
-    results["extractor_to_thread"] = test_loader_extractor_to_thread()
-
-    print("\nMain integration tests:")
-    results["main_params"] = test_main_threads_concurrency_params()
-
-    print("\nTest Summary:")
-    for test_name, result in results.items():
-        status = "PASSED" if result else "FAILED"
-        print(f"  {test_name}: {status}")
-
-    return all(results.values())
+    sections = [
+        (
+            "Summarizer async tests",
+            [
+                ("ainvoke", test_summarizer_uses_ainvoke),
+                ("async_file_io", test_summarizer_async_file_io),
+                ("log_lock", test_summarizer_has_log_lock),
+                ("concurrent_summarize", test_summarizer_concurrent_summarize_all),
+                ("summarizer_param", test_summarizer_max_concurrent_param),
+                ("write_read_helpers", test_summarizer_write_read_helpers),
+            ],
+        ),
+        (
+            "Loader async tests",
+            [
+                ("concurrent_crawl", test_loader_concurrent_crawling),
+                ("loader_param", test_loader_max_concurrent_param),
+                ("extractor_to_thread", test_loader_extractor_to_thread),
+                ("extractor_process_pool", test_extractor_process_pool),
+                ("normalize_url", test_loader_normalize_url),
+            ],
+        ),
+        (
+            "Main integration tests",
+            [
+                ("main_params", test_main_threads_concurrency_params),
+            ],
+        ),
+    ]
+
+    results = []
+    for section, tests in sections:
+        print(f"\n{section}:")
+        results.extend((name, test()) for name, test in tests)
+
+    summary = "\n".join(f"  {name}: {'PASSED' if result else 'FAILED'}" for name, result in results)
+    sys.stdout.write(f"\nTest Summary:\n{summary}\n")
+
+    return all(result for _, result in results)
 
 
 def main():
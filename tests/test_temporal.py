@@ -9,283 +9,349 @@ package without requiring a running Temporal server. They check:
 - CLI graceful fallback when temporalio is not installed
 """
 
+import asyncio
 import sys
 from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+# Imported once for the whole module; the activities and workflows modules
+# import temporalio, which is an optional dependency
+try:
+    from temporalio.testing import ActivityEnvironment
+
+    from llmstxt_architect.temporal.activities import (
+        DiscoverUrlsInput,
+        DiscoverUrlsOutput,
+        GenerateOutputInput,
+        LoadBatchInput,
+        LoadBatchOutput,
+        SaveCheckpointInput,
+        SummarizeDocBatchInput,
+        SummarizeDocInput,
+        SummarizeDocOutput,
+        _read_manifest_slice,
+        _stream_summary,
+        _write_manifest,
+        generate_output_file,
+    )
+    from llmstxt_architect.temporal.workflows import (
+        BATCH_SIZE,
+        SUMMARIZE_CHUNK_SIZE,
+        BatchProcessInput,
+        BatchProcessOutput,
+        CrawlAndSummarizeInput,
+        batch_size_for,
+        chunk_concurrency_for,
+        concurrent_batches_for,
+    )
+
+    _HAS_TEMPORAL = True
+except ImportError:
+    _HAS_TEMPORAL = False
+
+# Applied to the tests that need temporalio; the rest also run without it
+requires_temporal = pytest.mark.skipif(not _HAS_TEMPORAL, reason="temporalio not installed")
+
+# pyproject.toml next to tests/, read once for the packaging checks
+try:
+    _PYPROJECT_TEXT = (Path(__file__).resolve().parent.parent / "pyproject.toml").read_text()
+except OSError:
+    _PYPROJECT_TEXT = None
 
 
 def test_temporal_package_imports():
-    """Verify the temporal package and TASK_QUEUE constant import."""
-    try:
-        from llmstxt_architect.temporal import TASK_QUEUE
-
-        assert TASK_QUEUE == "llmstxt-architect", f"Expected 'llmstxt-architect', got '{TASK_QUEUE}'"
-
-        print("  Package imports test passed!")
-        return True
-    except Exception as e:
-        print(f"  Package imports test failed: {e}")
-        return False
-
-
-def test_activity_dataclasses_serializable():
-    """Verify activity input/output dataclasses are serializable."""
-    try:
-        try:
-            from llmstxt_architect.temporal.activities import (
-                DiscoverUrlsInput,
-                DiscoverUrlsOutput,
-                GenerateOutputInput,
-                LoadBatchInput,
-                LoadBatchOutput,
-                SaveCheckpointInput,
-                SummarizeDocInput,
-                SummarizeDocOutput,
-            )
-        except ImportError:
-            print("  Activity dataclasses test skipped (temporalio not installed)")
-            return True
-
-        # Test DiscoverUrlsInput
-        d = DiscoverUrlsInput(
-            urls=["https://example.com"],
-            project_dir="test_project",
-            max_depth=2,
-            extractor_name="bs4",
-        )
-        data = asdict(d)
-        assert data["urls"] == ["https://example.com"]
-        assert data["project_dir"] == "test_project"
-        assert data["max_depth"] == 2
-        assert data["extractor_name"] == "bs4"
-        assert data["existing_llms_file"] is None
-
-        # Test DiscoverUrlsOutput
-        out = DiscoverUrlsOutput(
-            manifest_path="/tmp/staging/manifest.json",
-            total_docs=5,
-        )
-        data = asdict(out)
-        assert data["manifest_path"] == "/tmp/staging/manifest.json"
-        assert data["total_docs"] == 5
-
-        # Test LoadBatchInput/Output
-        lb = LoadBatchInput(
-            manifest_path="/tmp/staging/manifest.json",
-            batch_start=0,
-            batch_end=10,
-        )
-        data = asdict(lb)
-        assert data["batch_start"] == 0
-        assert data["batch_end"] == 10
-
-        lbo = LoadBatchOutput(
-            doc_urls=["https://example.com"],
-            doc_content_files=["/tmp/staging/abc.txt"],
-            doc_titles=["Example"],
-        )
-        data = asdict(lbo)
-        assert len(data["doc_urls"]) == 1
-
-        # Test SummarizeDocInput
-        s = SummarizeDocInput(
-            url="https://example.com",
-            content_file="/tmp/staging/abc.txt",
-            title="Test",
-            llm_name="claude-3",
-            llm_provider="anthropic",
-            summary_prompt="Summarize",
-            output_dir="/tmp/out",
-        )
-        data = asdict(s)
-        assert data["url"] == "https://example.com"
-        assert data["blacklisted_urls"] == []
-        assert data["url_titles"] == {}
-
-        # Test SummarizeDocOutput
-        so = SummarizeDocOutput(
-            url="https://example.com",
-            summary="A summary",
-            filename="example.txt",
-        )
-        data = asdict(so)
-        assert data["skipped"] is False
-        assert data["error"] is None
-
-        # Test SaveCheckpointInput
-        sc = SaveCheckpointInput(
-            output_dir="/tmp/out",
-            summarized_urls={"url": "file.txt"},
-        )
-        data = asdict(sc)
-        assert "url" in data["summarized_urls"]
-
-        # Test GenerateOutputInput
-        go = GenerateOutputInput(
-            summaries=["summary1"],
-            output_file="llms.txt",
-            output_dir="/tmp/summaries",
-        )
-        data = asdict(go)
-        assert data["file_structure"] is None
-        assert data["blacklisted_urls"] == []
-
-        print("  Activity dataclasses test passed!")
-        return True
-    except Exception as e:
-        print(f"  Activity dataclasses test failed: {e}")
-        return False
-
-
-def test_workflow_dataclasses_serializable():
+    """Verify the temporal package and task queue constants import."""
+    from llmstxt_architect.temporal import FAST_TASK_QUEUE, TASK_QUEUE
+
+    assert TASK_QUEUE == "llmstxt-architect", f"Expected 'llmstxt-architect', got '{TASK_QUEUE}'"
+    assert FAST_TASK_QUEUE != TASK_QUEUE
+
+
+# Dataclass instances are shared across the serialization tests, which only read them
+@pytest.fixture(scope="module")
+def discover_input():
+    """DiscoverUrlsInput shared by this module's tests."""
+    return DiscoverUrlsInput(
+        urls=["https://example.com"],
+        project_dir="test_project",
+        max_depth=2,
+        extractor_name="bs4",
+    )
+
+
+@pytest.fixture(scope="module")
+def summarize_input():
+    """SummarizeDocInput shared by this module's tests."""
+    return SummarizeDocInput(
+        url="https://example.com",
+        content_file="/tmp/staging/abc.txt",
+        title="Test",
+        llm_name="claude-3",
+        llm_provider="anthropic",
+        summary_prompt="Summarize",
+        output_dir="/tmp/out",
+    )
+
+
+@requires_temporal
+def test_discover_urls_dataclasses(discover_input):
+    """Verify DiscoverUrlsInput/Output are serializable."""
+    assert isinstance(asdict(discover_input), dict)
+    assert discover_input.urls == ["https://example.com"]
+    assert discover_input.project_dir == "test_project"
+    assert discover_input.max_depth == 2
+    assert discover_input.extractor_name == "bs4"
+    assert discover_input.existing_llms_file is None
+
+    out = DiscoverUrlsOutput(
+        manifest_path="/tmp/staging/manifest.jsonl",
+        total_docs=5,
+    )
+    assert isinstance(asdict(out), dict)
+    assert out.manifest_path == "/tmp/staging/manifest.jsonl"
+    assert out.total_docs == 5
+    assert out.blacklist_path is None
+    assert out.docs is None
+
+
+@requires_temporal
+def test_load_batch_dataclasses():
+    """Verify LoadBatchInput/Output are serializable."""
+    lb = LoadBatchInput(
+        manifest_path="/tmp/staging/manifest.jsonl",
+        batch_start=0,
+        batch_end=10,
+    )
+    assert isinstance(asdict(lb), dict)
+    assert lb.batch_start == 0
+    assert lb.batch_end == 10
+
+    lbo = LoadBatchOutput(
+        doc_urls=["https://example.com"],
+        doc_content_files=["/tmp/staging/abc.txt"],
+        doc_titles=["Example"],
+    )
+    assert isinstance(asdict(lbo), dict)
+    assert len(lbo.doc_urls) == 1
+
+
+@requires_temporal
+def test_summarize_dataclasses(summarize_input):
+    """Verify the summarize activity inputs and output are serializable."""
+    assert isinstance(asdict(summarize_input), dict)
+    assert summarize_input.url == "https://example.com"
+    assert summarize_input.blacklist_path is None
+    assert summarize_input.url_titles_path is None
+
+    sb = SummarizeDocBatchInput(items=[summarize_input, summarize_input])
+    # Nested dataclasses serialize recursively
+    assert asdict(sb)["items"][0]["url"] == "https://example.com"
+    assert len(sb.items) == 2
+    assert sb.max_concurrency == 5
+
+    so = SummarizeDocOutput(
+        url="https://example.com",
+        summary="A summary",
+        filename="example.txt",
+    )
+    assert isinstance(asdict(so), dict)
+    assert so.skipped is False
+    assert so.error is None
+
+
+@requires_temporal
+def test_output_dataclasses():
+    """Verify SaveCheckpointInput and GenerateOutputInput are serializable."""
+    sc = SaveCheckpointInput(
+        output_dir="/tmp/out",
+        summarized_urls={"url": "file.txt"},
+    )
+    assert isinstance(asdict(sc), dict)
+    assert "url" in sc.summarized_urls
+
+    go = GenerateOutputInput(
+        summaries=["summary1"],
+        output_file="llms.txt",
+        output_dir="/tmp/summaries",
+    )
+    assert isinstance(asdict(go), dict)
+    assert go.file_structure is None
+    assert go.blacklisted_urls == []
+    assert go.summary_files is None
+    assert go.file_structure_path is None
+
+
+@requires_temporal
+def test_workflow_dataclasses_serializable(summarize_input):
     """Verify workflow input dataclasses are serializable."""
-    try:
-        from llmstxt_architect.temporal.workflows import (
-            BatchProcessInput,
-            BatchProcessOutput,
-            CrawlAndSummarizeInput,
-        )
-
-        # Test CrawlAndSummarizeInput with defaults
-        c = CrawlAndSummarizeInput(
-            urls=["https://example.com"],
-        )
-        data = asdict(c)
-        assert data["max_depth"] == 5
-        assert data["llm_provider"] == "anthropic"
-        assert data["max_concurrent_summaries"] == 5
-        assert data["blacklisted_urls"] == []
-        assert data["file_structure"] is None
-
-        # Test BatchProcessInput
-        b = BatchProcessInput(
-            doc_urls=["https://a.com", "https://b.com"],
-            doc_content_files=["/tmp/staging/a.txt", "/tmp/staging/b.txt"],
-            doc_titles=["A", "B"],
-            llm_name="claude-3",
-            llm_provider="anthropic",
-            summary_prompt="Summarize",
-            output_dir="/tmp/out",
-        )
-        data = asdict(b)
-        assert len(data["doc_urls"]) == 2
-        assert data["max_concurrent_summaries"] == 5
-
-        # Test BatchProcessOutput
-        bo = BatchProcessOutput(
-            summaries=["s1"],
-            summarized_urls={"url": "file.txt"},
-        )
-        data = asdict(bo)
-        assert len(data["summaries"]) == 1
-
-        print("  Workflow dataclasses test passed!")
-        return True
-    except ImportError:
-        # temporalio not installed — workflows import it
-        print("  Workflow dataclasses test skipped (temporalio not installed)")
-        return True
-    except Exception as e:
-        print(f"  Workflow dataclasses test failed: {e}")
-        return False
+    # Test CrawlAndSummarizeInput with defaults
+    c = CrawlAndSummarizeInput(
+        urls=["https://example.com"],
+    )
+    assert isinstance(asdict(c), dict)
+    assert c.max_depth == 5
+    assert c.llm_provider == "anthropic"
+    assert c.max_concurrent_summaries == 5
+    assert c.blacklisted_urls == []
+    assert c.file_structure is None
+    assert c.resume is None
+
+    # Test BatchProcessInput
+    b = BatchProcessInput(tasks=[summarize_input, summarize_input])
+    # Nested dataclasses serialize recursively
+    assert asdict(b)["tasks"][0]["url"] == "https://example.com"
+    assert len(b.tasks) == 2
+    assert b.max_concurrent_summaries == 5
+
+    # Test BatchProcessOutput
+    bo = BatchProcessOutput(
+        summarized_urls=[("url", "file.txt")],
+    )
+    assert asdict(bo)["summarized_urls"] == [("url", "file.txt")]
 
 
 def test_temporal_client_graceful_import():
     """Verify temporal client fails gracefully without temporalio."""
-    try:
-        import importlib.util
-
-        # Check if temporalio is available
-        temporalio_spec = importlib.util.find_spec("temporalio")
-        if temporalio_spec is not None:
-            # temporalio is installed — client should import fine
-            from llmstxt_architect.temporal.client import (
+    if _HAS_TEMPORAL:
+        # temporalio is installed — client should import fine
+        from llmstxt_architect.temporal.client import (
+            run_temporal_workflow,
+        )
+
+        assert callable(run_temporal_workflow)
+    else:
+        # temporalio not installed — import should raise
+        with pytest.raises(ImportError):
+            from llmstxt_architect.temporal.client import (  # noqa: F401
                 run_temporal_workflow,
             )
 
-            assert callable(run_temporal_workflow)
-            print("  Client import test passed! (temporalio installed)")
-            return True
-        else:
-            # temporalio not installed — import should raise
-            try:
-                from llmstxt_architect.temporal.client import (
-                    run_temporal_workflow,
-                )
-
-                print("  Client import test failed: should raise without temporalio")
-                return False
-            except ImportError:
-                print("  Client import test passed! (graceful ImportError)")
-                return True
-    except Exception as e:
-        print(f"  Client import test failed: {e}")
-        return False
-
 
 def test_worker_entry_point_defined():
     """Verify pyproject.toml has llmstxt-architect-worker entry point."""
-    try:
-        import os
-
-        # Find pyproject.toml relative to tests/
-        test_dir = os.path.dirname(os.path.abspath(__file__))
-        pyproject = os.path.join(test_dir, "..", "pyproject.toml")
-
-        with open(pyproject, "r") as f:
-            content = f.read()
-
-        assert "llmstxt-architect-worker" in content, "Worker entry point not in pyproject.toml"
-        assert "temporalio" in content, "temporalio not in pyproject.toml optional deps"
-
-        print("  Worker entry point test passed!")
-        return True
-    except Exception as e:
-        print(f"  Worker entry point test failed: {e}")
-        return False
+    assert _PYPROJECT_TEXT is not None, "pyproject.toml not found next to tests/"
+    assert "llmstxt-architect-worker" in _PYPROJECT_TEXT, "Worker entry point not in pyproject.toml"
+    assert "temporalio" in _PYPROJECT_TEXT, "temporalio not in pyproject.toml optional deps"
 
 
+@requires_temporal
 def test_batch_size_constant():
-    """Verify BATCH_SIZE is defined in workflows module."""
-    try:
-        from llmstxt_architect.temporal.workflows import BATCH_SIZE
-
-        assert isinstance(BATCH_SIZE, int)
-        assert BATCH_SIZE > 0
-
-        print("  Batch size constant test passed!")
-        return True
-    except ImportError:
-        print("  Batch size constant test skipped (temporalio not installed)")
-        return True
-    except Exception as e:
-        print(f"  Batch size constant test failed: {e}")
-        return False
-
-
-def run_tests():
-    """Run all temporal tests."""
-    results = {}
-
-    print("\nTemporal package tests:")
-    results["package_imports"] = test_temporal_package_imports()
-    results["activity_dataclasses"] = test_activity_dataclasses_serializable()
-    results["workflow_dataclasses"] = test_workflow_dataclasses_serializable()
-    results["client_graceful_import"] = test_temporal_client_graceful_import()
-    results["worker_entry_point"] = test_worker_entry_point_defined()
-    results["batch_size"] = test_batch_size_constant()
-
-    print("\nTest Summary:")
-    for test_name, result in results.items():
-        status = "PASSED" if result else "FAILED"
-        print(f"  {test_name}: {status}")
+    """Verify BATCH_SIZE is defined and batch sizes scale with max_concurrent_summaries."""
+    assert isinstance(BATCH_SIZE, int)
+    assert BATCH_SIZE > 0
+    assert batch_size_for(1) == BATCH_SIZE
+    assert batch_size_for(20) == 200
+
+
+@requires_temporal
+@pytest.mark.parametrize("max_concurrent_summaries", [1, 2, 3, 5, 10, 11, 25, 100])
+def test_summarize_concurrency_cap(max_concurrent_summaries):
+    """Verify LLM calls across all concurrent batch children stay within max_concurrent_summaries."""
+    children = concurrent_batches_for(max_concurrent_summaries)
+    chunks, calls_per_chunk = chunk_concurrency_for(max_concurrent_summaries // children)
+
+    assert 1 <= calls_per_chunk <= SUMMARIZE_CHUNK_SIZE
+    assert children * chunks * calls_per_chunk <= max_concurrent_summaries
+
+
+@requires_temporal
+@pytest.mark.parametrize(
+    "start,end,expected",
+    [
+        (0, 10, slice(0, 10)),
+        (10, 20, slice(10, 20)),
+        # Ranges past the end are clamped like list slicing
+        (20, 30, slice(20, 25)),
+        (30, 40, slice(25, 25)),
+    ],
+)
+def test_manifest_offset_index(tmp_path, start, end, expected):
+    """Verify manifest slices read through the offset index match the written entries."""
+    entries = [
+        {"url": f"https://example.com/{i}", "title": f"Page {i} ✓", "content_file": f"/tmp/{i}.txt"}
+        for i in range(25)
+    ]
+    manifest_path = tmp_path / "manifest.jsonl"
+    _write_manifest(manifest_path, entries)
+
+    assert _read_manifest_slice(str(manifest_path), start, end) == entries[expected]
+
+
+@requires_temporal
+def test_stream_summary_idle_timeout(monkeypatch):
+    """Verify a stalled LLM stream fails instead of hanging the activity."""
+    monkeypatch.setattr("llmstxt_architect.temporal.activities._FIRST_CHUNK_TIMEOUT", 0.2)
+    monkeypatch.setattr("llmstxt_architect.temporal.activities._STREAM_IDLE_TIMEOUT", 0.1)
+
+    class Chunk:
+        def __init__(self, content):
+            self.content = content
+
+    class FakeLLM:
+        def __init__(self, stall):
+            self.stall = stall
+
+        async def astream(self, messages):
+            yield Chunk("A ")
+            if self.stall:
+                await asyncio.sleep(60)
+            yield Chunk("summary")
+
+    assert asyncio.run(_stream_summary(FakeLLM(stall=False), [])) == "A summary"
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(_stream_summary(FakeLLM(stall=True), []))
+
+
+@requires_temporal
+def test_resumed_jsonl_output_matches_single_run(tmp_path):
+    """Verify a resumed JSONL run reads the earlier executions' files from the checkpoint log."""
+    summaries_dir = tmp_path / "summaries"
+    summaries_dir.mkdir()
+    entries = []
+    filenames = []
+    for i in range(4):
+        url = f"https://example.com/{i}"
+        entries.append({"url": url, "title": f"Page {i}", "content_file": f"/tmp/{i}.txt"})
+        filenames.append(f"page_{i}.txt")
+        (summaries_dir / filenames[-1]).write_text(f'{{"url": "{url}", "summary": "Summary {i}"}}')
+    # A leftover file from an unrelated run must not be picked up
+    (summaries_dir / "stale.txt").write_text('{"url": "https://example.com/stale", "summary": "Old"}')
+    manifest_path = tmp_path / "manifest.jsonl"
+    _write_manifest(manifest_path, entries)
+    # The first execution summarized documents 0 and 1 before continuing as new
+    (summaries_dir / "summarized_urls.json").write_text(
+        '{"https://example.com/0": "page_0.txt", "https://example.com/1": "page_1.txt"}'
+    )
+
+    def _generate(output_file, **kwargs):
+        output = str(tmp_path / output_file)
+        asyncio.run(
+            ActivityEnvironment().run(
+                generate_output_file,
+                GenerateOutputInput(
+                    summaries=[],
+                    output_file=output,
+                    output_dir=str(summaries_dir),
+                    output_format="jsonl",
+                    **kwargs,
+                ),
+            )
+        )
+        return Path(output).read_text()
 
-    return all(results.values())
+    single_run = _generate("single.jsonl", summary_files=filenames)
+    resumed = _generate(
+        "resumed.jsonl", summary_files=filenames[2:], manifest_path=str(manifest_path), earlier_docs=2
+    )
+    assert resumed == single_run
+    assert len(resumed.splitlines()) == 4
 
 
 def main():
-    """Main test function."""
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    """Run this file's tests with pytest."""
+    sys.exit(pytest.main([__file__, "-q"]))
 
 
 if __name__ == "__main__":